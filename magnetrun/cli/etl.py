@@ -1,15 +1,17 @@
 """ETL (Extract, Transform, Load) commands for format-specific data operations - Updated for JSON-based Field System."""
 
 import click
+import logging
+import os
 from pathlib import Path
-import pandas as pd
 from .utils import load_magnet_data, add_time_column_if_needed, handle_error
-from ..io.writers import DataWriter
 
 # CORRECTED: Import from new locations
 from ..formats import FormatRegistry, FormatDefinition
 from ..core.fields import Field, FieldType
 
+logger = logging.getLogger(__name__)
+
 
 @click.group(name='etl')
 def etl_commands():
@@ -37,7 +39,7 @@ def transform(ctx, files, housing, site, output_format, output_dir, normalize_un
         output_dir.mkdir(exist_ok=True)
     
     for file_path in files:
-        click.echo(f"Processing ETL for: {file_path}")
+        logger.info("Processing ETL for: %s", file_path)
         
         try:
             magnet_data, magnet_run = load_magnet_data(file_path, housing, site)
@@ -84,13 +86,13 @@ def migrate(ctx, files, housing, target_format, output_dir, preserve_metadata, m
         output_dir.mkdir(exist_ok=True)
     
     for file_path in files:
-        click.echo(f"Migrating: {file_path} -> {target_format}")
+        logger.info("Migrating: %s -> %s", file_path, target_format)
         
         try:
             magnet_data, magnet_run = load_magnet_data(file_path, housing)
             
             if magnet_data.format_type == target_format:
-                click.echo(f"  Skipping: already in {target_format} format")
+                logger.info("  Skipping: already in %s format", target_format)
                 continue
             
             # Perform migration
@@ -123,7 +125,7 @@ def validate(ctx, files, housing, check_units, check_ranges, check_missing, chec
     all_results = []
     
     for file_path in files:
-        click.echo(f"Validating: {file_path}")
+        logger.info("Validating: %s", file_path)
         
         try:
             magnet_data, magnet_run = load_magnet_data(file_path, housing)
@@ -173,16 +175,21 @@ def merge(ctx, input_files, housing, output_file, merge_strategy, time_align, pr
     try:
         datasets = []
         for file_path in input_files:
-            click.echo(f"  Loading: {file_path}")
+            logger.info("  Loading: %s", file_path)
             magnet_data, _ = load_magnet_data(file_path, housing)
             add_time_column_if_needed(magnet_data, debug)
             datasets.append(magnet_data)
         
-        # Perform merge based on strategy
-        merged_data = _merge_datasets(datasets, merge_strategy, time_align, preserve_field_info, debug)
-        
-        # Save merged data
-        _save_merged_data(merged_data, output_file, debug)
+        if merge_strategy == 'concat' and _can_stream_merge(datasets, output_file):
+            # Write each dataset straight to the output instead of building
+            # the concatenated frame in memory
+            _merge_datasets_streaming(datasets, output_file, preserve_field_info, debug)
+        else:
+            # Perform merge based on strategy
+            merged_data = _merge_datasets(datasets, merge_strategy, time_align, preserve_field_info, debug)
+            
+            # Save merged data
+            _save_merged_data(merged_data, output_file, debug)
         
         click.echo(f"Successfully merged data saved to: {output_file}")
         
@@ -229,6 +236,8 @@ class BaseETLProcessor:
         # Add field info as a separate sheet/table (for Excel) or as comments (for CSV)
         # For now, we'll add summary columns
         if field_info_data:
+            import pandas as pd
+
             # Create field summary
             field_summary = pd.DataFrame(field_info_data)
             # Store as attribute for later use
@@ -239,6 +248,7 @@ class BaseETLProcessor:
     def _normalize_units(self, magnet_data, data):
         """Normalize units to standard SI using field definitions."""
         format_def = magnet_data.field_registry
+        si_columns = {}
         
         for column in data.columns:
             field = format_def.get_field(column)
@@ -261,12 +271,15 @@ class BaseETLProcessor:
                     try:
                         # Convert values to SI
                         converted_values = magnet_data.convert_field_values(column, data[column], si_unit)
-                        data[f"{column}_SI"] = converted_values
+                        si_columns[f"{column}_SI"] = converted_values
                         # Optionally replace original column
                         # data[column] = converted_values
                     except Exception as e:
-                        if debug:
-                            click.echo(f"    Warning: Could not convert {column} to SI: {e}")
+                        logger.debug("    Warning: Could not convert %s to SI: %s", column, e)
+        
+        # Insert all converted columns at once instead of one block per column
+        if si_columns:
+            data = data.assign(**si_columns)
         
         return data
     
@@ -290,7 +303,7 @@ class PupitreETLProcessor(BaseETLProcessor):
     """ETL processor for Pupitre format data with field awareness."""
     
     def transform(self, magnet_data, normalize_units=False, add_metadata=False, add_field_info=False, validate=False, debug=False):
-        click.echo("  Applying Pupitre-specific transformations...")
+        logger.info("  Applying Pupitre-specific transformations...")
         
         data = super().transform(magnet_data, normalize_units, add_metadata, add_field_info, validate, debug)
         
@@ -335,7 +348,7 @@ class PigbrotherETLProcessor(BaseETLProcessor):
     """ETL processor for PigBrother TDMS format data with field management."""
     
     def transform(self, magnet_data, normalize_units=False, add_metadata=False, add_field_info=False, validate=False, debug=False):
-        click.echo("  Applying PigBrother TDMS-specific transformations...")
+        logger.info("  Applying PigBrother TDMS-specific transformations...")
         
         # For TDMS, we need to handle multiple groups
         transformed_groups = {}
@@ -343,7 +356,7 @@ class PigbrotherETLProcessor(BaseETLProcessor):
         # Get all groups from the data handler
         if hasattr(magnet_data._data_handler, 'data'):
             for group_name, group_data in magnet_data._data_handler.data.items():
-                click.echo(f"    Processing group: {group_name}")
+                logger.info("    Processing group: %s", group_name)
                 
                 # Create a temporary MagnetData-like object for the group
                 group_columns = [f"{group_name}/{col}" for col in group_data.columns]
@@ -390,6 +403,7 @@ class PigbrotherETLProcessor(BaseETLProcessor):
     def _normalize_tdms_units(self, magnet_data, data, group_name):
         """Normalize TDMS units using field definitions."""
         format_def = magnet_data.field_registry
+        si_columns = {}
         
         for col in data.columns:
             full_key = f"{group_name}/{col}"
@@ -407,10 +421,13 @@ class PigbrotherETLProcessor(BaseETLProcessor):
                 if field.unit != si_unit:
                     try:
                         converted_values = magnet_data.convert_field_values(full_key, data[col], si_unit)
-                        data[f"{col}_SI"] = converted_values
+                        si_columns[f"{col}_SI"] = converted_values
                     except Exception:
                         pass  # Skip conversion errors
         
+        if si_columns:
+            data = data.assign(**si_columns)
+        
         return data
     
     def _add_tdms_metadata(self, magnet_data, data, group_name):
@@ -430,7 +447,7 @@ class BprofileETLProcessor(BaseETLProcessor):
     """ETL processor for Bprofile format data with field management."""
     
     def transform(self, magnet_data, normalize_units=False, add_metadata=False, add_field_info=False, validate=False, debug=False):
-        click.echo("  Applying Bprofile-specific transformations...")
+        logger.info("  Applying Bprofile-specific transformations...")
         
         data = super().transform(magnet_data, normalize_units, add_metadata, add_field_info, validate, debug)
         
@@ -530,6 +547,8 @@ class BaseValidator:
     
     def _check_data_ranges(self, magnet_data, data, results):
         """Check data ranges using field definitions."""
+        import pandas as pd
+
         format_def = magnet_data.field_registry
         
         for col in data.columns:
@@ -613,13 +632,45 @@ def _save_data_file(data, output_path, output_format):
         output_file = output_path.with_suffix('.xlsx')
         # Save field summary as separate sheet if available
         if hasattr(data, '_field_summary'):
-            with pd.ExcelWriter(output_file) as writer:
-                data.to_excel(writer, sheet_name='Data', index=False)
-                data._field_summary.to_excel(writer, sheet_name='Field_Info', index=False)
+            _write_excel(output_file, {'Data': data, 'Field_Info': data._field_summary})
         else:
-            data.to_excel(output_file, index=False)
+            _write_excel(output_file, {'Sheet1': data})
+    
+    logger.info("  Saved: %s", output_file)
+
+def _write_excel(output_path, sheets):
+    """Write DataFrames to an Excel workbook, one sheet per entry of sheets.
+    
+    When xlsxwriter is installed the workbook is written in constant_memory
+    mode: each row is flushed to disk as soon as it is complete, so memory
+    stays bounded by a single row instead of the whole workbook. That mode
+    requires strict row order, which DataFrame.to_excel does not follow,
+    so rows are written here directly.
+    """
+    import pandas as pd
+    
+    try:
+        import xlsxwriter
+    except ImportError:
+        with pd.ExcelWriter(output_path) as writer:
+            for sheet_name, frame in sheets.items():
+                frame.to_excel(writer, sheet_name=sheet_name, index=False)
+        return
     
-    click.echo(f"  Saved: {output_file}")
+    # Same datetime display format as DataFrame.to_excel
+    workbook = xlsxwriter.Workbook(
+        str(output_path),
+        {'constant_memory': True, 'default_date_format': 'yyyy-mm-dd hh:mm:ss'},
+    )
+    try:
+        for sheet_name, frame in sheets.items():
+            worksheet = workbook.add_worksheet(sheet_name)
+            worksheet.write_row(0, 0, [str(col) for col in frame.columns])
+            for row_index, row in enumerate(frame.itertuples(index=False, name=None), 1):
+                # Leave missing values (NaN, None, NaT, pd.NA) empty, as to_excel does
+                worksheet.write_row(row_index, 0, [None if pd.isna(value) else value for value in row])
+    finally:
+        workbook.close()
 
 def _migrate_format(magnet_data, target_format, preserve_metadata, map_fields, debug):
     """Migrate data to target format with field mapping."""
@@ -669,7 +720,7 @@ def _save_migrated_data(data, file_path, target_format, output_dir, debug):
         output_path = Path(file_path).parent / f"{base_name}_migrated_{target_format}.csv"
     
     data.to_csv(output_path, index=False)
-    click.echo(f"  Migrated data saved: {output_path}")
+    logger.info("  Migrated data saved: %s", output_path)
 
 def _display_validation_results(results, file_path):
     """Display validation results."""
@@ -691,6 +742,8 @@ def _display_validation_results(results, file_path):
 
 def _export_validation_report(all_results):
     """Export validation report to file."""
+    import pandas as pd
+
     report_df = pd.DataFrame(all_results)
     report_path = Path("validation_report.csv")
     report_df.to_csv(report_path, index=False)
@@ -699,9 +752,12 @@ def _export_validation_report(all_results):
 def _merge_datasets(datasets, merge_strategy, time_align, preserve_field_info, debug):
     """Merge multiple datasets with field information preservation."""
     if merge_strategy == 'concat':
+        import pandas as pd
+
         # Simple concatenation with field info preservation
         all_data = []
-        field_info_summary = []
+        field_info_summary = _new_field_info_summary()
+        field_info_cache = {}
         
         for i, dataset in enumerate(datasets):
             data = dataset.get_data()
@@ -709,24 +765,16 @@ def _merge_datasets(datasets, merge_strategy, time_align, preserve_field_info, d
             data['source_index'] = i
             
             if preserve_field_info:
-                # Collect field information
-                for col in data.columns:
-                    if col not in ['source_file', 'source_index']:
-                        field_info = dataset.get_field_info(col)
-                        symbol, unit_obj, unit_string = field_info
-                        field_info_summary.append({
-                            'source_file': dataset.filename,
-                            'column': col,
-                            'symbol': symbol,
-                            'unit': unit_string,
-                            'format': dataset.format_type
-                        })
+                _collect_field_info(dataset, data.columns, field_info_summary, field_info_cache)
             
             all_data.append(data)
         
-        merged_data = pd.concat(all_data, ignore_index=True)
+        merged_data = _concat_frames(all_data)
+        
+        # One entry per input file: store provenance as a categorical
+        merged_data['source_file'] = merged_data['source_file'].astype('category')
         
-        if preserve_field_info and field_info_summary:
+        if preserve_field_info and field_info_summary['column']:
             # Store field info for later use
             merged_data._field_info = pd.DataFrame(field_info_summary)
         
@@ -735,40 +783,239 @@ def _merge_datasets(datasets, merge_strategy, time_align, preserve_field_info, d
     elif merge_strategy == 'join':
         # Join on common columns (like time) with field compatibility checking
         if time_align and all(dataset.has_key('t') for dataset in datasets):
-            merged = datasets[0].get_data(['t'])
+            # Index every dataset on time and align them all in one pass
+            # rather than re-copying the growing result with one merge per file
+            frames = [datasets[0].get_data(['t']).set_index('t')]
+            seen_cols = set()
+            
+            # Resolve each dataset's units once, only when mismatches are
+            # reported; a column's reference unit is the one from the first
+            # dataset that defines it
+            reference_units = {}
+            unit_maps = []
+            if preserve_field_info and debug:
+                unit_maps = [_unit_map(dataset) for dataset in datasets]
+                for unit_map in unit_maps:
+                    for col, unit in unit_map.items():
+                        reference_units.setdefault(col, unit)
             
             for i, dataset in enumerate(datasets[1:], 1):
-                data = dataset.get_data()
+                data = dataset.get_data().set_index('t')
                 
                 # Check for field compatibility when merging
-                common_cols = set(merged.columns) & set(data.columns)
-                if common_cols and preserve_field_info:
-                    for col in common_cols:
-                        if col != 't':  # Skip time column
-                            field1 = datasets[0].get_field_info(col)
-                            field2 = dataset.get_field_info(col)
-                            if field1[2] != field2[2]:  # Different units
-                                if debug:
-                                    click.echo(f"    Warning: Unit mismatch for {col}: {field1[2]} vs {field2[2]}")
+                common_cols = seen_cols & set(data.columns)
+                if common_cols and preserve_field_info and debug:
+                    for col in sorted(common_cols):
+                        unit = unit_maps[i].get(col)
+                        reference_unit = reference_units.get(col)
+                        if unit != reference_unit:  # Different units
+                            click.echo(f"    Warning: Unit mismatch for {col}: {reference_unit} vs {unit}")
+                
+                # Same naming as merge(suffixes=('', f'_file{i}'))
+                if common_cols:
+                    data = data.rename(columns={col: f"{col}_file{i}" for col in common_cols})
                 
-                merged = merged.merge(data, on='t', how='outer', suffixes=('', f'_file{i}'))
+                seen_cols.update(data.columns)
+                frames.append(data)
+            
+            if all(frame.index.is_unique for frame in frames):
+                merged = _align_on_time(frames)
+            else:
+                # Repeated time stamps cannot be aligned by index
+                merged = frames[0].reset_index()
+                for frame in frames[1:]:
+                    merged = merged.merge(frame.reset_index(), on='t', how='outer')
             
             return merged
     
     # Default fallback
     return datasets[0].get_data()
 
+def _concat_frames(frames):
+    """Concatenate DataFrames row-wise, copying numeric columns only once.
+    
+    When all frames share the same set of columns (in any order), each
+    column is filled into a single preallocated NumPy buffer instead of
+    going through the BlockManager. Mixed schemas use pd.concat.
+    """
+    import numpy as np
+    import pandas as pd
+    
+    columns = frames[0].columns
+    schemas = {frozenset(frame.columns) for frame in frames}
+    if len(schemas) > 1 or not all(frame.columns.is_unique for frame in frames):
+        return pd.concat(frames, ignore_index=True)
+    
+    total_rows = sum(len(frame) for frame in frames)
+    merged_columns = {}
+    
+    for col in columns:
+        dtype = frames[0][col].dtype
+        if isinstance(dtype, np.dtype) and dtype.kind in 'biufcmM' and all(frame[col].dtype == dtype for frame in frames[1:]):
+            buffer = np.empty(total_rows, dtype=dtype)
+            offset = 0
+            for frame in frames:
+                n_rows = len(frame)
+                buffer[offset:offset + n_rows] = frame[col].to_numpy()
+                offset += n_rows
+            merged_columns[col] = buffer
+        else:
+            merged_columns[col] = pd.concat([frame[col] for frame in frames], ignore_index=True)
+    
+    return pd.DataFrame(merged_columns, columns=columns, copy=False)
+
+def _new_field_info_summary():
+    """Create an empty field info summary as parallel column lists."""
+    return {'source_file': [], 'column': [], 'symbol': [], 'unit': [], 'format': []}
+
+def _collect_field_info(dataset, columns, summary, cache=None):
+    """Append field information for the given dataset columns to summary.
+    
+    The summary is kept as one list per output column (see
+    _new_field_info_summary) and turned into a DataFrame once at the end.
+    Field info only depends on the format and column name, so when merging
+    many files of the same format a shared cache dict avoids resolving the
+    same field again for every dataset.
+    """
+    for col in columns:
+        if col not in ['source_file', 'source_index']:
+            cache_key = (dataset.format_type, col)
+            if cache is not None and cache_key in cache:
+                symbol, unit_string = cache[cache_key]
+            else:
+                symbol, unit_obj, unit_string = dataset.get_field_info(col)
+                if cache is not None:
+                    cache[cache_key] = (symbol, unit_string)
+            summary['source_file'].append(dataset.filename)
+            summary['column'].append(col)
+            summary['symbol'].append(symbol)
+            summary['unit'].append(unit_string)
+            summary['format'].append(dataset.format_type)
+
+def _align_on_time(frames):
+    """Outer-join frames indexed by unique time values in a single pass.
+    
+    The union of all time stamps is computed once and each frame is
+    reindexed onto it, which is equivalent to a chain of outer merges on
+    't' without rewriting the result for each frame. Frames that already
+    cover every time stamp are used as they are, so their dtypes are kept.
+    """
+    import numpy as np
+    import pandas as pd
+    
+    times = pd.Index(np.unique(np.concatenate([frame.index.to_numpy() for frame in frames])), name='t')
+    aligned = [frame if frame.index.equals(times) else frame.reindex(times) for frame in frames]
+    return pd.concat(aligned, axis=1).reset_index()
+
+def _unit_map(dataset):
+    """Map each non-time column of a dataset to its unit string."""
+    return {col: dataset.get_field_info(col)[2] for col in dataset.keys if col != 't'}
+
+def _can_stream_merge(datasets, output_file):
+    """Check whether a concat merge can be streamed to the output file.
+    
+    Streaming writes one dataset at a time against the schema of the first
+    one, so all datasets must share the same columns and dtypes. Parquet
+    output additionally requires pyarrow.
+    """
+    suffix = Path(output_file).suffix
+    if suffix == '.parquet':
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            return False
+    elif suffix != '.csv':
+        return False
+    
+    first_keys = list(datasets[0].keys)
+    if any(list(dataset.keys) != first_keys for dataset in datasets[1:]):
+        return False
+    
+    first_dtypes = datasets[0].get_dtypes()
+    return all(dataset.get_dtypes().equals(first_dtypes) for dataset in datasets[1:])
+
+def _merge_datasets_streaming(datasets, output_file, preserve_field_info, debug):
+    """Concatenate datasets by appending them one at a time to the output file.
+    
+    Only a single dataset is materialized at any time, which keeps peak memory
+    at the size of the largest input instead of the whole merged result. The
+    rows go to a temporary file renamed into place once complete, so a failed
+    merge never leaves a truncated output behind.
+    """
+    output_path = Path(output_file)
+    part_path = output_path.with_name(f"{output_path.name}.part")
+    field_info_summary = _new_field_info_summary()
+    field_info_cache = {}
+    writer = None
+    schema = None
+    
+    try:
+        for i, dataset in enumerate(datasets):
+            data = dataset.get_data()
+            data['source_file'] = dataset.filename
+            data['source_index'] = i
+            
+            if preserve_field_info:
+                _collect_field_info(dataset, data.columns, field_info_summary, field_info_cache)
+            
+            # Store provenance as a categorical, as the in-memory merge does
+            data['source_file'] = data['source_file'].astype('category')
+            
+            if output_path.suffix == '.parquet':
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+                
+                # Infer the schema from the first dataset only and lock every
+                # later table to it, avoiding per-chunk inference and casts
+                if writer is None:
+                    schema = pa.Schema.from_pandas(data, preserve_index=False)
+                    writer = pq.ParquetWriter(part_path, schema, compression='zstd', use_dictionary=True)
+                writer.write_table(pa.Table.from_pandas(data, schema=schema, preserve_index=False))
+            else:
+                data.to_csv(part_path, mode='w' if i == 0 else 'a', header=(i == 0), index=False)
+            
+            if debug:
+                click.echo(f"    Appended {len(data)} rows from {dataset.filename}")
+        
+        if writer is not None:
+            writer.close()
+            writer = None
+        os.replace(part_path, output_path)
+    finally:
+        if writer is not None:
+            writer.close()
+        if part_path.exists():
+            part_path.unlink()
+    
+    if preserve_field_info and field_info_summary['column']:
+        import pandas as pd
+        
+        field_info_path = output_path.with_suffix('.field_info.csv')
+        pd.DataFrame(field_info_summary).to_csv(field_info_path, index=False)
+        if debug:
+            click.echo(f"    Field information saved to: {field_info_path}")
+
+def _write_csv(data, output_path, chunksize=100_000):
+    """Write a DataFrame to CSV in row chunks through a single buffered file.
+    
+    The output is identical to data.to_csv(output_path, index=False).
+    """
+    with open(output_path, 'w', buffering=4 * 1024 * 1024, newline='') as f:
+        data.iloc[:chunksize].to_csv(f, index=False)
+        for start in range(chunksize, len(data), chunksize):
+            data.iloc[start:start + chunksize].to_csv(f, header=False, index=False)
+
 def _save_merged_data(data, output_file, debug):
     """Save merged data with field information if available."""
     output_path = Path(output_file)
     
     if output_path.suffix == '.csv':
-        data.to_csv(output_path, index=False)
+        _write_csv(data, output_path)
         
         # Save field info separately if available
         if hasattr(data, '_field_info'):
             field_info_path = output_path.with_suffix('.field_info.csv')
-            data._field_info.to_csv(field_info_path, index=False)
+            _write_csv(data._field_info, field_info_path)
             if debug:
                 click.echo(f"    Field information saved to: {field_info_path}")
                 
@@ -776,13 +1023,20 @@ def _save_merged_data(data, output_file, debug):
         data.to_json(output_path, orient='records', indent=2)
     elif output_path.suffix == '.parquet':
         data.to_parquet(output_path, index=False)
+        
+        # Parquet holds a single table: save field info next to it, as CSV
+        if hasattr(data, '_field_info'):
+            field_info_path = output_path.with_suffix('.field_info.csv')
+            _write_csv(data._field_info, field_info_path)
+            if debug:
+                click.echo(f"    Field information saved to: {field_info_path}")
     elif output_path.suffix in ['.xlsx', '.xls']:
         # Save with field info as separate sheet
-        with pd.ExcelWriter(output_path) as writer:
-            data.to_excel(writer, sheet_name='Data', index=False)
-            if hasattr(data, '_field_info'):
-                data._field_info.to_excel(writer, sheet_name='Field_Info', index=False)
+        sheets = {'Data': data}
+        if hasattr(data, '_field_info'):
+            sheets['Field_Info'] = data._field_info
+        _write_excel(output_path, sheets)
     else:
         # Default to CSV
         output_path = output_path.with_suffix('.csv')
-        data.to_csv(output_path, index=False)
+        _write_csv(data, output_path)
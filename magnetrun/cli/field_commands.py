@@ -2,13 +2,29 @@
 """Field management CLI commands for MagnetRun - Updated for Simplified Field System."""
 
 import click
-import json
+import functools
+from collections import Counter
 from pathlib import Path
 from typing import List, Optional
 import pandas as pd
 
-from ..core.simplified_field_system import FormatRegistry, FormatDefinition, Field, FieldType
+from .._json import dumps
+from ..formats import FormatRegistry, FormatDefinition
+from ..formats.registry import get_format_registry
+from ..core.fields import Field, FieldType
 from ..core.magnet_data import MagnetData
+from .utils import map_files
+
+
+# Validation statuses ordered by severity
+_STATUS_SEVERITY = {'PASS': 0, 'WARNING': 1, 'ERROR': 2}
+_SEVERITY_STATUS = {severity: status for status, severity in _STATUS_SEVERITY.items()}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_format(format_name: str) -> Optional[FormatDefinition]:
+    """Get a format definition from the shared registry, memoized per name."""
+    return get_format_registry().get_format(format_name)
 
 
 @click.group(name='field')
@@ -41,7 +57,7 @@ def formats(show_details, show_fields, export_csv):
         magnetrun field formats --show-details
         magnetrun field formats --show-fields --export-csv formats.csv
     """
-    registry = FormatRegistry()
+    registry = get_format_registry()
     available_formats = registry.list_formats()
     
     click.echo("📋 Available Format Definitions:")
@@ -50,7 +66,7 @@ def formats(show_details, show_fields, export_csv):
     format_data = []
     
     for format_name in available_formats:
-        format_def = registry.get_format(format_name)
+        format_def = _get_format(format_name)
         if format_def:
             field_count = len(format_def.fields)
             field_types = set(f.field_type.value for f in format_def.fields.values())
@@ -72,10 +88,7 @@ def formats(show_details, show_fields, export_csv):
                 click.echo(f"   Metadata keys: {list(format_def.metadata.keys())}")
             
             if show_fields:
-                type_counts = {}
-                for field in format_def.fields.values():
-                    field_type = field.field_type.value
-                    type_counts[field_type] = type_counts.get(field_type, 0) + 1
+                type_counts = Counter(f.field_type.value for f in format_def.fields.values())
                 
                 click.echo("   Field type distribution:")
                 for field_type, count in sorted(type_counts.items()):
@@ -96,72 +109,48 @@ def formats(show_details, show_fields, export_csv):
 @click.option('--output-report', type=click.Path(), help='Save validation report to file')
 @click.option('--report-format', type=click.Choice(['json', 'csv', 'text']), 
               default='text', help='Output format for validation report')
-def check(files, format_name, strict, show_coverage, show_issues, output_report, report_format):
+@click.option('--jobs', '-j', type=int, default=None,
+              help='Number of worker processes (default: number of CPUs)')
+@click.option('--sample-rows', type=click.IntRange(min=1), default=None,
+              help='Only load the first N rows of each file for validation')
+def check(files, format_name, strict, show_coverage, show_issues, output_report, report_format, jobs,
+          sample_rows):
     """Check data files against field definitions.
     
     Validates file format, field presence, data quality, and coverage
-    using comprehensive built-in field definitions.
+    using comprehensive built-in field definitions. Files are validated
+    in parallel worker processes.
     
     Examples:
         magnetrun field check *.tdms
         magnetrun field check data.txt --format pupitre --strict
         magnetrun field check experiment/*.csv --show-coverage
+        magnetrun field check *.tdms --sample-rows 1000
         magnetrun field check data.tdms --output-report validation.json --report-format json
     """
-    registry = FormatRegistry()
+    registry = get_format_registry()
     validation_results = []
-    overall_status = "PASS"
+    overall_severity = _STATUS_SEVERITY['PASS']
+    
+    # Override format if specified
+    if format_name and format_name not in registry.list_formats():
+        click.echo(f"❌ Unknown format: {format_name}", err=True)
+        return
     
     click.echo(f"🔍 Validating {len(files)} files...")
     
-    with click.progressbar(files, label='Processing files') as file_bar:
-        for file_path in file_bar:
-            try:
-                # Load data
-                magnet_data = MagnetData.from_file(file_path)
-                
-                # Override format if specified
-                if format_name:
-                    if format_name not in registry.list_formats():
-                        click.echo(f"❌ Unknown format: {format_name}", err=True)
-                        continue
-                    magnet_data._format_name = format_name
-                    magnet_data._format_def = registry.get_format(format_name)
-                
-                # Validate
-                validation_summary = magnet_data.get_field_validation_summary()
-                file_result = {
-                    'file': str(file_path),
-                    'format': magnet_data.format_type,
-                    'summary': validation_summary['summary'],
-                    'field_results': validation_summary['field_results'] if show_issues else {}
-                }
-                
-                # Determine status
-                coverage = validation_summary['summary']['coverage_percent']
-                quality = validation_summary['summary']['quality_percent']
-                
-                if coverage < 50:
-                    file_result['status'] = 'ERROR'
-                    overall_status = 'ERROR'
-                elif quality < 80 or coverage < 80:
-                    file_result['status'] = 'WARNING'
-                    if overall_status != 'ERROR':
-                        overall_status = 'WARNING'
-                else:
-                    file_result['status'] = 'PASS'
-                
-                validation_results.append(file_result)
-                
-            except Exception as e:
-                error_result = {
-                    'file': str(file_path),
-                    'status': 'ERROR',
-                    'error': str(e),
-                    'summary': {}
-                }
-                validation_results.append(error_result)
-                overall_status = 'ERROR'
+    validate_one = functools.partial(
+        _validate_one, format_name=format_name, show_issues=show_issues, nrows=sample_rows
+    )
+    
+    # Results come back in input order as workers finish
+    with click.progressbar(map_files(validate_one, files, jobs), length=len(files),
+                           label='Processing files') as result_bar:
+        for file_result in result_bar:
+            validation_results.append(file_result)
+            overall_severity = max(overall_severity, _STATUS_SEVERITY[file_result['status']])
+    
+    overall_status = _SEVERITY_STATUS[overall_severity]
     
     # Display results
     _display_validation_summary(validation_results, overall_status, show_coverage, show_issues)
@@ -193,11 +182,11 @@ def info(format_name, show_fields, show_units, show_types, field_name, export_cs
         magnetrun field info --field-name "Field" --format pupitre
         magnetrun field info --show-types --export-csv field_types.csv
     """
-    registry = FormatRegistry()
+    registry = get_format_registry()
     
     if format_name:
         # Show specific format info
-        format_def = registry.get_format(format_name)
+        format_def = _get_format(format_name)
         if not format_def:
             click.echo(f"❌ Format '{format_name}' not found", err=True)
             return
@@ -209,14 +198,11 @@ def info(format_name, show_fields, show_units, show_types, field_name, export_cs
         click.echo("=" * 50)
         
         for fmt_name in registry.list_formats():
-            fmt_def = registry.get_format(fmt_name)
+            fmt_def = _get_format(fmt_name)
             if fmt_def:
                 click.echo(f"\n{fmt_name.upper()}: {len(fmt_def.fields)} fields")
                 if show_types:
-                    type_counts = {}
-                    for field in fmt_def.fields.values():
-                        field_type = field.field_type.value
-                        type_counts[field_type] = type_counts.get(field_type, 0) + 1
+                    type_counts = Counter(f.field_type.value for f in fmt_def.fields.values())
                     for field_type, count in sorted(type_counts.items()):
                         click.echo(f"  {field_type}: {count}")
     
@@ -231,7 +217,7 @@ def info(format_name, show_fields, show_units, show_types, field_name, export_cs
 @click.option('--from-unit', required=True, help='Source unit')
 @click.option('--to-unit', required=True, help='Target unit')
 @click.option('--show-values', is_flag=True, help='Show sample converted values')
-@click.option('--save-converted', type=click.Path(), help='Save converted data to file')
+@click.option('--save-converted', type=click.Path(), help='Save converted field (with time column) to CSV')
 def convert(data_file, field_name, from_unit, to_unit, show_values, save_converted):
     """Convert field values between units.
     
@@ -262,19 +248,27 @@ def convert(data_file, field_name, from_unit, to_unit, show_values, save_convert
         click.echo(f"🔄 Conversion: {from_unit} → {to_unit}")
         click.echo(f"   Factor: {conversion_factor}")
         
+        # Units without an offset (everything but e.g. degC <-> K) convert with
+        # a single vectorized multiply instead of a per-value pint conversion
+        is_linear = field.convert_value(0.0, to_unit, format_def.ureg) == 0.0
+        
         if show_values:
             data = magnet_data.get_data([field_name])
             original_values = data[field_name].head(5)
-            converted_values = magnet_data.convert_field_values(field_name, original_values, to_unit)
+            converted_values = _convert_values(
+                magnet_data, field_name, original_values, to_unit, conversion_factor, is_linear
+            )
             
             click.echo("\n📊 Sample Values:")
             for orig, conv in zip(original_values, converted_values):
                 click.echo(f"   {orig:10.3f} {from_unit} → {conv:10.3f} {to_unit}")
         
         if save_converted:
-            data = magnet_data.get_data()
-            data[f"{field_name}_{to_unit}"] = magnet_data.convert_field_values(
-                field_name, data[field_name], to_unit
+            # Only materialize the converted field and the time axis, not every column
+            keys = ['t', field_name] if magnet_data.has_key('t') and field_name != 't' else [field_name]
+            data = magnet_data.get_data(keys)
+            data[f"{field_name}_{to_unit}"] = _convert_values(
+                magnet_data, field_name, data[field_name], to_unit, conversion_factor, is_linear
             )
             data.to_csv(save_converted, index=False)
             click.echo(f"💾 Converted data saved to: {save_converted}")
@@ -296,7 +290,7 @@ def compare(formats, field_types, show_units, export_csv):
         magnetrun field compare --field-types magnetic_field,current --show-units
         magnetrun field compare --formats all --export-csv comparison.csv
     """
-    registry = FormatRegistry()
+    registry = get_format_registry()
     
     if formats == 'all':
         format_list = registry.list_formats()
@@ -317,10 +311,11 @@ def compare(formats, field_types, show_units, export_csv):
     
     comparison_data = []
     all_field_names = set()
+    format_defs = {format_name: _get_format(format_name) for format_name in format_list}
     
     # Collect all field names
     for format_name in format_list:
-        format_def = registry.get_format(format_name)
+        format_def = format_defs[format_name]
         if format_def:
             all_field_names.update(format_def.fields.keys())
     
@@ -329,21 +324,26 @@ def compare(formats, field_types, show_units, export_csv):
         type_list = [t.strip() for t in field_types.split(',')]
         filtered_field_names = set()
         for format_name in format_list:
-            format_def = registry.get_format(format_name)
+            format_def = format_defs[format_name]
             if format_def:
                 for field_name, field in format_def.fields.items():
                     if field.field_type.value in type_list:
                         filtered_field_names.add(field_name)
         all_field_names = filtered_field_names
     
+    # Field tables per format, so each cell below is a single dict lookup
+    format_fields = {
+        format_name: format_def.fields if format_def else {}
+        for format_name, format_def in format_defs.items()
+    }
+    
     # Create comparison
     for field_name in sorted(all_field_names):
         row_data = {'field_name': field_name}
         
         click.echo(f"\n🔧 {field_name}")
         for format_name in format_list:
-            format_def = registry.get_format(format_name)
-            field = format_def.get_field(field_name) if format_def else None
+            field = format_fields[format_name].get(field_name)
             
             if field:
                 symbol = field.symbol
@@ -375,6 +375,61 @@ def compare(formats, field_types, show_units, export_csv):
 
 
 # Helper functions
+def _validate_one(file_path: str, format_name: Optional[str] = None, show_issues: bool = False,
+                  nrows: Optional[int] = None) -> dict:
+    """Validate a single file against its field definitions.
+    
+    Runs in a worker process, so errors are reported in the result instead
+    of being raised.
+    """
+    try:
+        # Reject files no reader can handle from their header, without parsing
+        if not format_name and MagnetData.peek_format(file_path) is None:
+            return {
+                'file': str(file_path),
+                'status': 'ERROR',
+                'error': f"Unknown file format: {file_path}",
+                'summary': {}
+            }
+        
+        # Load data (optionally only a leading sample of rows)
+        magnet_data = MagnetData.from_file(file_path, nrows=nrows)
+        
+        if format_name:
+            magnet_data._format_name = format_name
+            magnet_data._format_def = _get_format(format_name)
+        
+        # Validate
+        validation_summary = magnet_data.get_field_validation_summary()
+        file_result = {
+            'file': str(file_path),
+            'format': magnet_data.format_type,
+            'summary': validation_summary['summary'],
+            'field_results': validation_summary['field_results'] if show_issues else {}
+        }
+        
+        # Determine status
+        coverage = validation_summary['summary']['coverage_percent']
+        quality = validation_summary['summary']['quality_percent']
+        
+        if coverage < 50:
+            file_result['status'] = 'ERROR'
+        elif quality < 80 or coverage < 80:
+            file_result['status'] = 'WARNING'
+        else:
+            file_result['status'] = 'PASS'
+        
+        return file_result
+        
+    except Exception as e:
+        return {
+            'file': str(file_path),
+            'status': 'ERROR',
+            'error': str(e),
+            'summary': {}
+        }
+
+
 def _display_validation_summary(results: List, overall_status: str, show_coverage: bool, show_issues: bool):
     """Display validation summary."""
     total_files = len(results)
@@ -410,13 +465,20 @@ def _display_validation_summary(results: List, overall_status: str, show_coverag
                         click.echo(f"    ❌ {field_name}: {status}")
 
 
+def _convert_values(magnet_data: MagnetData, field_name: str, values: pd.Series, to_unit: str,
+                    conversion_factor: float, is_linear: bool):
+    """Convert field values, scaling by the conversion factor when the units are linear."""
+    if is_linear:
+        return values.to_numpy() * conversion_factor
+    return magnet_data.convert_field_values(field_name, values, to_unit)
+
+
 def _save_validation_report(results: List, output_path: Path, format: str):
     """Save validation report to file."""
     output_path = Path(output_path)
     
     if format == 'json':
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        output_path.write_bytes(dumps(results))
     elif format == 'csv':
         # Flatten results for CSV
         flattened = []
@@ -477,10 +539,7 @@ def _display_format_info(format_def: FormatDefinition, show_fields: bool, show_u
             click.echo(f"❌ Field '{field_name}' not found in format '{format_def.format_name}'")
     
     if show_types:
-        type_counts = {}
-        for field in format_def.fields.values():
-            field_type = field.field_type.value
-            type_counts[field_type] = type_counts.get(field_type, 0) + 1
+        type_counts = Counter(f.field_type.value for f in format_def.fields.values())
         
         click.echo("\n🏷️  Field Type Distribution:")
         for field_type, count in sorted(type_counts.items()):
@@ -500,42 +559,20 @@ def _export_fields_to_csv(registry: FormatRegistry, format_name: str, output_fil
     """Export field definitions to CSV."""    
     import csv
     
-    field_data = []
-    
-    if format_name:
-        # Export specific format
-        format_def = registry.get_format(format_name)
-        if format_def:
-            for field in format_def.fields.values():
-                field_data.append({
-                    'format': format_name,
-                    'name': field.name,
-                    'symbol': field.symbol,
-                    'field_type': field.field_type.value,
-                    'unit': field.unit,
-                    'description': field.description
-                })
-    else:
-        # Export all formats
-        for fmt_name in registry.list_formats():
-            format_def = registry.get_format(fmt_name)
-            if format_def:
-                for field in format_def.fields.values():
-                    field_data.append({
-                        'format': fmt_name,
-                        'name': field.name,
-                        'symbol': field.symbol,
-                        'field_type': field.field_type.value,
-                        'unit': field.unit,
-                        'description': field.description
-                    })
+    format_names = [format_name] if format_name else registry.list_formats()
     
     with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-        if field_data:
-            fieldnames = field_data[0].keys()
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(field_data)
+        writer = csv.writer(csvfile)
+        writer.writerow(('format', 'name', 'symbol', 'field_type', 'unit', 'description'))
+        
+        # Stream rows straight from the field definitions
+        for fmt_name in format_names:
+            format_def = _get_format(fmt_name)
+            if format_def:
+                writer.writerows(
+                    (fmt_name, field.name, field.symbol, field.field_type.value, field.unit, field.description)
+                    for field in format_def.fields.values()
+                )
 
 
 # Register all commands
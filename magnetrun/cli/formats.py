@@ -1,18 +1,20 @@
 """CLI commands for format management with centralized configuration system."""
 
+import csv
+import io
 import os
-import json
 import sys
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Set, Tuple
 import click
-from tabulate import tabulate
-import pandas as pd
 
 # UPDATED: Import from centralized config system
+from .._json import dumps, loads
 from ..formats.centralized_config import get_config_manager
 from ..formats.registry import FormatRegistry
-from ..formats.format_definition import FormatDefinition
+from ..formats.format_definition import FormatDefinition, get_global_ureg
 from ..core.fields import (
     FieldType,
     validate_format_definition,
@@ -27,6 +29,102 @@ def formats():
     pass
 
 
+def _echo_json(obj) -> None:
+    """Write obj as indented JSON straight to the stdout byte stream."""
+    sys.stdout.flush()  # keep ordering with any pending text output
+    stdout = click.get_binary_stream("stdout")
+    stdout.write(dumps(obj))
+    stdout.write(b"\n")
+    stdout.flush()
+
+
+def _trunc(text: str, width: int = 50) -> str:
+    """Truncate text to width characters, appending an ellipsis if cut."""
+    return text if len(text) <= width else text[:width] + "..."
+
+
+def _column_widths(headers, rows) -> list:
+    """Compute the display width of each column over headers and str rows."""
+    return [
+        max(len(header), max((len(row[i]) for row in rows), default=0))
+        for i, header in enumerate(headers)
+    ]
+
+
+def _render_grid(headers, rows, simple: bool = False, widths=None) -> str:
+    """Render rows as a text table in tabulate's "grid" or "simple" style."""
+    rows = [[str(cell) for cell in row] for row in rows]
+    if widths is None:
+        widths = _column_widths(headers, rows)
+
+    if simple:
+        lines = ["  ".join(f"{h:<{w}}" for h, w in zip(headers, widths)).rstrip()]
+        lines.append("  ".join("-" * w for w in widths))
+        for row in rows:
+            lines.append("  ".join(f"{c:<{w}}" for c, w in zip(row, widths)).rstrip())
+        return "\n".join(lines)
+
+    border = "+" + "+".join("-" * (w + 2) for w in widths) + "+"
+    lines = [border]
+    lines.append("| " + " | ".join(f"{h:<{w}}" for h, w in zip(headers, widths)) + " |")
+    lines.append(border.replace("-", "="))
+    for row in rows:
+        lines.append("| " + " | ".join(f"{c:<{w}}" for c, w in zip(row, widths)) + " |")
+        lines.append(border)
+    return "\n".join(lines)
+
+
+def _scan_configs_dir(path: Path) -> Tuple[List[Path], List[Path]]:
+    """Split the files of a directory into JSON and other files.
+
+    Symlinks to files are followed, as Path.is_file() does.
+    """
+    json_files, other_files = [], []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            if entry.name.endswith(".json"):
+                json_files.append(Path(entry.path))
+            else:
+                other_files.append(Path(entry.path))
+    return json_files, other_files
+
+
+def _path_error(path: str, param_hint: str, error: OSError) -> click.BadParameter:
+    """Report a path argument that could not be opened as a usage error."""
+    return click.BadParameter(
+        f"'{path}': {error.strerror}", param_hint=f"'{param_hint}'"
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_registry(config_manager) -> FormatRegistry:
+    """Return a FormatRegistry shared by all helpers of one invocation."""
+    return FormatRegistry(config_manager)
+
+
+def _load_format(config_manager, format_name: str) -> Optional[FormatDefinition]:
+    """Look up a format, loading the registry only if its config file exists."""
+    if not config_manager.has_format(format_name):
+        return None
+    return _get_registry(config_manager).get_format(format_name)
+
+
+def _emit_not_found(config_manager, format_name: str) -> None:
+    """Report an unknown format along with the available ones."""
+    click.echo(f"Format '{format_name}' not found.", err=True)
+    available_formats = config_manager.list_configs("format")
+    if available_formats:
+        click.echo("Available formats:")
+        for name in available_formats:
+            click.echo(f"  {name}")
+    else:
+        click.echo(
+            "No format definitions available. Run 'magnetrun config init' to create defaults."
+        )
+
+
 @formats.command()
 @click.option("--detailed", "-d", is_flag=True, help="Show detailed field information")
 @click.option(
@@ -51,25 +149,23 @@ def list(detailed: bool, output_format: str):
     if output_format == "json":
         if detailed:
             output = {}
-            registry = FormatRegistry(config_manager)
-            for name in format_names:
-                format_def = registry.get_format(name)
+            registry = _get_registry(config_manager)
+            for name, format_def in registry.get_all_formats().items():
                 if format_def:
                     output[name] = create_field_summary(format_def)
                 else:
                     output[name] = {"error": "Failed to load format definition"}
-            click.echo(json.dumps(output, indent=2))
+            _echo_json(output)
         else:
-            click.echo(json.dumps(format_names, indent=2))
+            _echo_json(format_names)
         return
 
     # Table output
     if detailed:
         table_data = []
-        registry = FormatRegistry(config_manager)
+        registry = _get_registry(config_manager)
 
-        for name in format_names:
-            format_def = registry.get_format(name)
+        for name, format_def in registry.get_all_formats().items():
             if format_def:
                 summary = create_field_summary(format_def)
 
@@ -102,15 +198,13 @@ def list(detailed: bool, output_format: str):
             "Description",
             "Config Path",
         ]
-        click.echo(tabulate(table_data, headers=headers, tablefmt="grid"))
+        click.echo(_render_grid(headers, table_data))
     else:
         click.echo("Available format definitions:")
-        registry = FormatRegistry(config_manager)
         for name in format_names:
-            format_def = registry.get_format(name)
-            description = "No description"
-            if format_def:
-                description = format_def.metadata.get("description", "No description")
+            description = config_manager.peek_metadata("format", name).get(
+                "description", "No description"
+            )
             click.echo(f"  {name:<15} - {description}")
 
 
@@ -130,36 +224,33 @@ def list(detailed: bool, output_format: str):
 def show(format_name: str, output: Optional[str], output_format: str):
     """Show detailed information about a format definition from centralized config."""
     config_manager = get_config_manager()
-    registry = FormatRegistry(config_manager)
-    format_def = registry.get_format(format_name)
+    format_def = _load_format(config_manager, format_name)
 
     if not format_def:
-        click.echo(f"Format '{format_name}' not found.", err=True)
-        available_formats = config_manager.list_configs("format")
-        if available_formats:
-            click.echo("Available formats:")
-            for name in available_formats:
-                click.echo(f"  {name}")
-        else:
-            click.echo(
-                "No format definitions available. Run 'magnetrun config init' to create defaults."
-            )
+        _emit_not_found(config_manager, format_name)
         sys.exit(1)
 
-    if output_format == "json":
-        output_data = format_def.to_dict()
-        content = json.dumps(output_data, indent=2)
-    elif output_format == "summary":
-        summary = create_field_summary(format_def)
-        content = json.dumps(summary, indent=2)
-    else:  # table
-        content = _format_definition_to_table(format_def)
-        # Add config path information
-        config_path = config_manager.get_format_config_path(format_name)
-        content += f"\n\nConfiguration file: {config_path}"
+    if output_format in ("json", "summary"):
+        if output_format == "json":
+            output_data = format_def.to_dict()
+        else:
+            output_data = create_field_summary(format_def)
+
+        if output:
+            Path(output).write_bytes(dumps(output_data))
+            click.echo(f"Format definition saved to {output}")
+        else:
+            _echo_json(output_data)
+        return
+
+    # table
+    content = _format_definition_to_table(format_def)
+    # Add config path information
+    config_path = config_manager.get_format_config_path(format_name)
+    content += f"\n\nConfiguration file: {config_path}"
 
     if output:
-        Path(output).write_text(content)
+        Path(output).write_bytes(content.encode("utf-8"))
         click.echo(f"Format definition saved to {output}")
     else:
         click.echo(content)
@@ -170,7 +261,7 @@ def show(format_name: str, output: Optional[str], output_format: str):
 def reload(verbose: bool):
     """Reload all format definitions from centralized configuration."""
     config_manager = get_config_manager()
-    registry = FormatRegistry(config_manager)
+    registry = _get_registry(config_manager)
 
     old_count = len(registry.list_formats())
 
@@ -179,15 +270,16 @@ def reload(verbose: bool):
 
     # Clear caches and reload
     config_manager.clear_cache()
-    registry.reload_formats()
+    _get_registry.cache_clear()
+    registry = _get_registry(config_manager)
 
-    new_count = len(registry.list_formats())
+    format_items = list(registry.items())
+    new_count = len(format_items)
 
     click.echo(f"Reloaded {new_count} formats (was {old_count})")
 
     if verbose:
-        for format_name in registry.list_formats():
-            format_def = registry.get_format(format_name)
+        for format_name, format_def in format_items:
             if format_def:
                 click.echo(f"  {format_name}: {len(format_def.fields)} fields")
             else:
@@ -204,19 +296,17 @@ def configs():
     click.echo(f"Directory exists: {configs_dir.exists()}")
 
     if configs_dir.exists():
-        json_files = list(configs_dir.glob("*.json"))
+        json_files, other_files = _scan_configs_dir(configs_dir)
+
         click.echo(f"\nJSON config files ({len(json_files)}):")
         for json_file in json_files:
             click.echo(f"  {json_file.name}")
 
         # Show any non-JSON files (might be user additions)
-        other_files = [
-            f for f in configs_dir.iterdir() if f.is_file() and f.suffix != ".json"
-        ]
         if other_files:
             click.echo("\nOther files:")
             for other_file in other_files:
-                click.echo("  {other_file.name}")
+                click.echo(f"  {other_file.name}")
     else:
         click.echo(
             "\nDirectory does not exist. Run 'magnetrun config init' to create it."
@@ -241,7 +331,7 @@ def edit(format_name: str, editor: Optional[str]):
     config_manager = get_config_manager()
     config_file = config_manager.get_format_config_path(format_name)
 
-    if not config_file.exists():
+    if not config_manager.has_format(format_name):
         click.echo(f"Format configuration '{format_name}' does not exist.")
         available_formats = config_manager.list_configs("format")
         if available_formats:
@@ -278,8 +368,7 @@ def edit(format_name: str, editor: Optional[str]):
 def export(format_name: str, output: Optional[str]):
     """Export a format definition to JSON file."""
     config_manager = get_config_manager()
-    registry = FormatRegistry(config_manager)
-    format_def = registry.get_format(format_name)
+    format_def = _load_format(config_manager, format_name)
 
     if not format_def:
         click.echo(f"Format '{format_name}' not found.", err=True)
@@ -293,17 +382,21 @@ def export(format_name: str, output: Optional[str]):
 
 
 @formats.command()
-@click.argument("filepath", type=click.Path(exists=True))
+@click.argument("filepath", type=click.Path())
 @click.option("--name", help="Override format name from file")
 @click.option("--install", is_flag=True, help="Install to centralized config directory")
 def import_format(filepath: str, name: Optional[str], install: bool):
     """Import a format definition from JSON file to centralized config."""
     try:
         config_manager = get_config_manager()
-        registry = FormatRegistry(config_manager)
 
-        # Load the format definition
-        format_def = FormatDefinition.load_from_file(filepath, registry.ureg)
+        # Load the format definition; --install only needs the config paths,
+        # so the registry (which parses every format) is not loaded for it
+        try:
+            data = Path(filepath).read_bytes()
+        except OSError as e:
+            raise _path_error(filepath, "FILEPATH", e)
+        format_def = FormatDefinition.load_from_bytes(data, get_global_ureg())
 
         if name:
             format_def.format_name = name
@@ -328,7 +421,7 @@ def import_format(filepath: str, name: Optional[str], install: bool):
                 sys.exit(1)
         else:
             # Just register temporarily (not persistent)
-            registry.register_format_definition(format_def)
+            _get_registry(config_manager).register_format_definition(format_def)
             click.echo(
                 f"Format '{format_def.format_name}' imported successfully (temporary)."
             )
@@ -340,6 +433,8 @@ def import_format(filepath: str, name: Optional[str], install: bool):
         for field_type, info in summary["by_type"].items():
             click.echo(f"  {field_type}: {info['count']} fields")
 
+    except click.ClickException:
+        raise
     except Exception as e:
         click.echo(f"Failed to import format: {e}", err=True)
         sys.exit(1)
@@ -350,8 +445,7 @@ def import_format(filepath: str, name: Optional[str], install: bool):
 def validate(format_name: str):
     """Validate a format definition for common issues."""
     config_manager = get_config_manager()
-    registry = FormatRegistry(config_manager)
-    format_def = registry.get_format(format_name)
+    format_def = _load_format(config_manager, format_name)
 
     if not format_def:
         click.echo(f"Format '{format_name}' not found.", err=True)
@@ -387,12 +481,33 @@ def validate(format_name: str):
             click.echo(f"  {field_type}: {count}")
 
 
+def _validate_one(format_name: str) -> Optional[dict]:
+    """Load and validate a single format definition in a worker process."""
+    config_data = get_config_manager().load_config("format", format_name)
+    if not config_data:
+        return None
+    try:
+        format_def = FormatDefinition.from_dict(config_data, get_global_ureg())
+    except Exception:
+        return None
+    return validate_format_definition(format_def)
+
+
 @formats.command()
 @click.option("--all", is_flag=True, help="Validate all format definitions")
-def validate_all(all):
+@click.option(
+    "--jobs",
+    "-j",
+    type=int,
+    default=None,
+    help="Number of worker processes (default: number of CPUs)",
+)
+def validate_all(all, jobs):
     """Validate all format definitions in centralized config."""
+    # Imported here so listing formats does not load the data stack
+    from .utils import map_files
+
     config_manager = get_config_manager()
-    registry = FormatRegistry(config_manager)
 
     format_names = config_manager.list_configs("format")
     if not format_names:
@@ -405,14 +520,13 @@ def validate_all(all):
     total_invalid = 0
     validation_results = []
 
-    for format_name in format_names:
-        format_def = registry.get_format(format_name)
-        if not format_def:
+    validations = map_files(_validate_one, format_names, jobs, chunksize=4)
+    for format_name, validation in zip(format_names, validations):
+        if validation is None:
             click.echo(f"❌ {format_name}: Failed to load")
             total_invalid += 1
             continue
 
-        validation = validate_format_definition(format_def)
         validation_results.append((format_name, validation))
 
         if validation["valid"]:
@@ -461,35 +575,32 @@ def fields(
 ):
     """List fields in a format definition from centralized config."""
     config_manager = get_config_manager()
-    registry = FormatRegistry(config_manager)
-    format_def = registry.get_format(format_name)
+    format_def = _load_format(config_manager, format_name)
 
     if not format_def:
         click.echo(f"Format '{format_name}' not found.", err=True)
         sys.exit(1)
 
     # Collect field data
-    field_data = []
-    for field in format_def.fields.values():
+    search_lower = search.lower() if search else None
+    wanted_type = FieldType(field_type) if field_type else None
+    field_data = [
+        {
+            "name": field.name,
+            "type": field.field_type.value,
+            "unit": field.unit,
+            "symbol": field.symbol,
+            "description": field.description,
+        }
+        for field in format_def.fields.values()
         # Apply filters
-        if field_type and field.field_type.value != field_type:
-            continue
-        if (
-            search
-            and search.lower() not in field.name.lower()
-            and search.lower() not in field.description.lower()
-        ):
-            continue
-
-        field_data.append(
-            {
-                "name": field.name,
-                "type": field.field_type.value,
-                "unit": field.unit,
-                "symbol": field.symbol,
-                "description": field.description,
-            }
+        if (wanted_type is None or field.field_type is wanted_type)
+        and (
+            not search_lower
+            or search_lower in field.name.lower()
+            or search_lower in field.description.lower()
         )
+    ]
 
     if not field_data:
         click.echo("No fields match the criteria.")
@@ -497,8 +608,14 @@ def fields(
 
     if output:
         # Save to CSV
-        df = pd.DataFrame(field_data)
-        df.to_csv(output, index=False)
+        with open(output, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(
+                f,
+                fieldnames=["name", "type", "unit", "symbol", "description"],
+                lineterminator="\n",
+            )
+            writer.writeheader()
+            writer.writerows(field_data)
         click.echo(f"Field data saved to {output}")
     else:
         # Display as table
@@ -509,15 +626,11 @@ def fields(
                 f["type"],
                 f["unit"],
                 f["symbol"],
-                (
-                    f["description"][:50] + "..."
-                    if len(f["description"]) > 50
-                    else f["description"]
-                ),
+                _trunc(f["description"]),
             ]
             for f in field_data
         ]
-        click.echo(tabulate(table_data, headers=headers, tablefmt="grid"))
+        click.echo(_render_grid(headers, table_data))
 
     # Show config file path
     config_path = config_manager.get_format_config_path(format_name)
@@ -526,7 +639,7 @@ def fields(
 
 @formats.command()
 @click.argument("format_name")
-@click.argument("data_file", type=click.Path(exists=True))
+@click.argument("data_file", type=click.Path())
 @click.option("--output", "-o", type=click.Path(), help="Output file for new format")
 @click.option("--description", help="Description for the new format")
 @click.option("--install", is_flag=True, help="Install to centralized config")
@@ -542,21 +655,22 @@ def create(
         # Try to read the data file to get column names
         file_path = Path(data_file)
 
-        if file_path.suffix.lower() == ".csv":
-            df = pd.read_csv(file_path, nrows=0)  # Just read headers
-            data_keys = df.columns.tolist()
-        elif file_path.suffix.lower() == ".txt":
-            # Try both comma and whitespace separated
-            try:
-                df = pd.read_csv(file_path, nrows=0)
-                data_keys = df.columns.tolist()
-            except Exception:
-                df = pd.read_csv(file_path, sep=r"\s+", nrows=0)
-                data_keys = df.columns.tolist()
-        else:
+        if file_path.suffix.lower() not in (".csv", ".txt"):
             click.echo(f"Unsupported file format: {file_path.suffix}", err=True)
             sys.exit(1)
 
+        try:
+            with open(file_path, "r", encoding="utf-8", newline="") as f:
+                header = f.readline()  # Just read headers
+        except OSError as e:
+            raise _path_error(data_file, "DATA_FILE", e)
+
+        # .txt is comma separated if the header has commas, whitespace otherwise
+        if file_path.suffix.lower() == ".csv" or "," in header:
+            data_keys = next(csv.reader([header]), [])
+        else:
+            data_keys = header.split()
+
         # Create format definition using centralized config
         config_manager = get_config_manager()
         format_def = create_format_config_from_data(
@@ -604,6 +718,8 @@ def create(
             )
         click.echo(f"   magnetrun formats validate {format_name}")
 
+    except click.ClickException:
+        raise
     except Exception as e:
         click.echo(f"Failed to create format: {e}", err=True)
         sys.exit(1)
@@ -628,7 +744,13 @@ def merge(
     from ..core.fields.utils import merge_format_definitions
 
     config_manager = get_config_manager()
-    registry = FormatRegistry(config_manager)
+    # Check the config files first so a typo does not load the registry
+    for name, label in ((base_format, "Base"), (overlay_format, "Overlay")):
+        if not config_manager.has_format(name):
+            click.echo(f"{label} format '{name}' not found.", err=True)
+            sys.exit(1)
+
+    registry = _get_registry(config_manager)
 
     base_def = registry.get_format(base_format)
     if not base_def:
@@ -683,13 +805,13 @@ def backup(export_dir: Optional[str]):
 
     if not export_dir:
         export_dir = (
-            f"magnetrun_formats_backup_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}"
+            f"magnetrun_formats_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         )
 
     export_path = Path(export_dir)
     export_path.mkdir(parents=True, exist_ok=True)
 
-    registry = FormatRegistry(config_manager)
+    registry = _get_registry(config_manager)
     results = registry.export_all_formats(export_path)
 
     exported_count = sum(1 for success in results.values() if success)
@@ -703,23 +825,48 @@ def backup(export_dir: Optional[str]):
                 click.echo(f"  - {format_name}")
 
     # Also copy the entire formats directory
-    import shutil
-
     formats_backup = export_path / "configs_backup"
     try:
-        shutil.copytree(config_manager.config_paths.formats_dir, formats_backup)
+        _parallel_copytree(config_manager.config_paths.formats_dir, formats_backup)
         click.echo(f"✅ Full formats directory backed up to {formats_backup}")
     except Exception as e:
         click.echo(f"⚠️  Warning: Could not backup full directory: {e}")
 
 
+def _parallel_copytree(src: Path, dst: Path, workers: int = 8) -> None:
+    """Copy a directory tree like shutil.copytree, copying files in threads."""
+    import shutil
+    from concurrent.futures import ThreadPoolExecutor
+
+    os.makedirs(dst)
+    pairs = []
+    directories = []
+    # Follow symlinked directories, as copytree does with symlinks=False
+    for root, dirs, files in os.walk(src, followlinks=True):
+        target = os.path.join(dst, os.path.relpath(root, src))
+        directories.append((root, target))
+        for name in dirs:
+            os.makedirs(os.path.join(target, name), exist_ok=True)
+        pairs.extend(
+            (os.path.join(root, name), os.path.join(target, name)) for name in files
+        )
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for _ in executor.map(lambda pair: shutil.copy2(*pair), pairs):
+            pass
+
+    # Directory metadata last, deepest first, so file copies don't touch it
+    for root, target in reversed(directories):
+        shutil.copystat(root, target)
+
+
 @formats.command()
 @click.argument("import_dir", type=click.Path(exists=True))
 @click.option("--overwrite", is_flag=True, help="Overwrite existing formats")
 def restore(import_dir: str, overwrite: bool):
     """Restore format configurations to centralized config from backup."""
     config_manager = get_config_manager()
-    registry = FormatRegistry(config_manager)
+    registry = _get_registry(config_manager)
 
     import_path = Path(import_dir)
     results = registry.import_formats_from_directory(import_path, overwrite=overwrite)
@@ -759,30 +906,24 @@ def _format_definition_to_table(format_def: FormatDefinition) -> str:
     # Fields by type
     output.append(f"\nFields ({len(format_def.fields)} total):")
 
-    for field_type in FieldType:
-        fields_of_type = format_def.get_fields_by_type(field_type)
-        if fields_of_type:
-            output.append(
-                f"\n{field_type.value.upper().replace('_', ' ')} ({len(fields_of_type)}):"
-            )
-
-            table_data = []
-            for field in fields_of_type:
-                table_data.append(
-                    [
-                        field.name,
-                        field.symbol,
-                        field.unit,
-                        (
-                            field.description[:60] + "..."
-                            if len(field.description) > 60
-                            else field.description
-                        ),
-                    ]
-                )
+    sections = [
+        (
+            f"\n{field_type.value.upper().replace('_', ' ')} ({len(fields_of_type)}):",
+            [
+                [field.name, field.symbol, field.unit, _trunc(field.description, 60)]
+                for field in fields_of_type
+            ],
+        )
+        for field_type, fields_of_type in format_def.group_fields_by_type().items()
+        if fields_of_type
+    ]
 
-            headers = ["Name", "Symbol", "Unit", "Description"]
-            output.append(tabulate(table_data, headers=headers, tablefmt="simple"))
+    # Share column widths so all sections line up
+    headers = ["Name", "Symbol", "Unit", "Description"]
+    widths = _column_widths(headers, [row for _, rows in sections for row in rows])
+    for label, rows in sections:
+        output.append(label)
+        output.append(_render_grid(headers, rows, simple=True, widths=widths))
 
     return "\n".join(output)
 
@@ -792,7 +933,7 @@ def _format_definition_to_table(format_def: FormatDefinition) -> str:
 def status():
     """Show centralized configuration system status."""
     config_manager = get_config_manager()
-    registry = FormatRegistry(config_manager)
+    registry = _get_registry(config_manager)
 
     click.echo("🔧 Format Configuration System Status")
     click.echo("=" * 50)
@@ -845,7 +986,7 @@ def status():
             )
 
         headers = ["Format", "Status", "Fields", "File", "Description"]
-        click.echo(tabulate(table_data, headers=headers, tablefmt="grid"))
+        click.echo(_render_grid(headers, table_data))
 
     # Environment variables
     click.echo("\nEnvironment variables:")
@@ -882,20 +1023,75 @@ def status():
             click.echo(f"  • {rec}")
 
 
+_ECHO_BATCH = 64
+
+
+def _flush_echo(buffer: io.StringIO) -> None:
+    """Echo the buffered lines in one write and reset the buffer."""
+    if buffer.tell():
+        click.echo(buffer.getvalue(), nl=False)
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def _migrate_one(
+    config_manager, existing: Set[str], json_file: Path, overwrite: bool
+) -> Tuple[str, str, Optional[str]]:
+    """Migrate a single format file.
+
+    Returns (format_name, status, error) where status is one of
+    "migrated", "skipped" or "failed".
+    """
+    format_name = json_file.stem
+
+    # Check if already exists
+    if not overwrite and format_name in existing:
+        return format_name, "skipped", None
+
+    try:
+        # Load and validate the JSON file
+        config_data = loads(json_file.read_bytes())
+
+        # Basic validation for format files
+        if "format_name" not in config_data:
+            config_data["format_name"] = format_name
+
+        if "metadata" not in config_data:
+            config_data["metadata"] = {}
+
+        if "description" not in config_data["metadata"]:
+            config_data["metadata"]["description"] = f"Migrated from {json_file.name}"
+
+        # Save to centralized config
+        success = config_manager.save_config(
+            "format", format_name, config_data, overwrite=overwrite
+        )
+        return format_name, "migrated" if success else "failed", None
+
+    except FileExistsError:
+        return format_name, "skipped", None
+    except Exception as e:
+        return format_name, "failed", str(e)
+
+
 # Add command to migrate from old hardcoded configs
 @formats.command()
-@click.argument("source_dir", type=click.Path(exists=True))
+@click.argument("source_dir", type=click.Path())
 @click.option(
     "--dry-run", is_flag=True, help="Show what would be migrated without doing it"
 )
 @click.option("--overwrite", is_flag=True, help="Overwrite existing configurations")
-def migrate_from_old(source_dir: str, dry_run: bool, overwrite: bool):
+@click.option("--quiet", "-q", is_flag=True, help="Only print the summary")
+def migrate_from_old(source_dir: str, dry_run: bool, overwrite: bool, quiet: bool):
     """Migrate format definitions from old hardcoded config directory."""
     config_manager = get_config_manager()
     source_path = Path(source_dir)
 
     # Look for JSON files in the source directory
-    json_files = list(source_path.glob("*.json"))
+    try:
+        json_files, _ = _scan_configs_dir(source_path)
+    except OSError as e:
+        raise _path_error(source_dir, "SOURCE_DIR", e)
 
     if not json_files:
         click.echo(f"No JSON files found in {source_path}")
@@ -907,50 +1103,53 @@ def migrate_from_old(source_dir: str, dry_run: bool, overwrite: bool):
     skipped_count = 0
     errors = []
 
-    for json_file in json_files:
-        format_name = json_file.stem
+    # Per-file status lines are buffered and echoed in batches
+    buffer = io.StringIO()
 
-        if dry_run:
-            click.echo(f"Would migrate: {json_file.name} -> {format_name}")
-            continue
+    def report(message: str):
+        if not quiet:
+            buffer.write(message + "\n")
 
-        # Check if already exists
-        existing_config = config_manager.load_config("format", format_name)
-        if existing_config and not overwrite:
-            click.echo(f"⏭️  Skipped {format_name} (already exists)")
-            skipped_count += 1
-            continue
-
-        try:
-            # Load and validate the JSON file
-            with open(json_file, "r", encoding="utf-8") as f:
-                config_data = json.load(f)
-
-            # Basic validation for format files
-            if "format_name" not in config_data:
-                config_data["format_name"] = format_name
-
-            if "metadata" not in config_data:
-                config_data["metadata"] = {}
-
-            if "description" not in config_data["metadata"]:
-                config_data["metadata"][
-                    "description"
-                ] = f"Migrated from {json_file.name}"
-
-            # Save to centralized config
-            success = config_manager.save_config("format", format_name, config_data)
-
-            if success:
-                click.echo(f"✅ Migrated {format_name}")
-                migrated_count += 1
-            else:
-                click.echo(f"❌ Failed to migrate {format_name}")
-                errors.append(format_name)
+    if dry_run:
+        for index, json_file in enumerate(json_files):
+            if index % _ECHO_BATCH == 0:
+                _flush_echo(buffer)
+            report(f"Would migrate: {json_file.name} -> {json_file.stem}")
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        # One scan of the formats directory instead of a stat per file;
+        # save_config(overwrite=False) still refuses to clobber late arrivals
+        existing: Set[str] = set()
+        formats_dir = config_manager.config_paths.formats_dir
+        if not overwrite and formats_dir.is_dir():
+            existing = {path.stem for path in _scan_configs_dir(formats_dir)[0]}
+
+        def migrate_one(json_file: Path):
+            return _migrate_one(config_manager, existing, json_file, overwrite)
+
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map() keeps results in input order so the report stays stable
+            results = executor.map(migrate_one, json_files)
+            for index, (format_name, status, error) in enumerate(results):
+                if index % _ECHO_BATCH == 0:
+                    _flush_echo(buffer)
+
+                if status == "migrated":
+                    report(f"✅ Migrated {format_name}")
+                    migrated_count += 1
+                elif status == "skipped":
+                    report(f"⏭️  Skipped {format_name} (already exists)")
+                    skipped_count += 1
+                elif error:
+                    report(f"❌ Error migrating {format_name}: {error}")
+                    errors.append(format_name)
+                else:
+                    report(f"❌ Failed to migrate {format_name}")
+                    errors.append(format_name)
 
-        except Exception as e:
-            click.echo(f"❌ Error migrating {format_name}: {e}")
-            errors.append(format_name)
+    _flush_echo(buffer)
 
     if dry_run:
         click.echo(f"\nDry run complete. Would migrate {len(json_files)} files.")
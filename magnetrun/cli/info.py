@@ -1,15 +1,28 @@
 """Information and validation commands."""
 
+import csv
+import functools
+import os
+import re
+from collections import defaultdict
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 import click
 from pathlib import Path
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
 
 # FIXED: Import directly from module instead of top-level package
 from ..core.magnet_data import MagnetData
 from ..core.magnet_run import MagnetRun
 from ..io.writers import DataWriter
 from ..formats.registry import get_format_registry
+from ..io.base_reader import read_header
 from ..io.format_detector import FormatDetector
-from .utils import handle_error
+from .utils import map_files
 
 
 def load_magnet_data(file_path, housing, site=""):
@@ -31,143 +44,237 @@ def info_commands():
 @click.option("--site", default="", help="Site identifier")
 @click.option("--list-keys", is_flag=True, help="List available data keys")
 @click.option("--convert", is_flag=True, help="Convert to CSV format")
+@click.option(
+    "--jobs",
+    "-j",
+    type=int,
+    default=None,
+    help="Number of worker processes (default: number of CPUs)",
+)
 @click.pass_context
-def show(ctx, files, housing, site, list_keys, convert):
+def show(ctx, files, housing, site, list_keys, convert, jobs):
     """Display information about data files."""
     debug = ctx.obj.get("DEBUG", False)
 
-    for file_path in files:
-        click.echo(f"Processing: {file_path}")
-
-        try:
-            magnet_data, magnet_run = load_magnet_data(file_path, housing, site)
-
-            if debug:
-                click.echo(f"  Debug: File extension: {Path(file_path).suffix}")
-                click.echo(f"  Debug: Format type: {magnet_data.format_type}")
-
-            click.echo(f"  Housing: {magnet_run.housing}")
-            click.echo(f"  Site: {magnet_run.site}")
-            click.echo(f"  Format: {magnet_data.format_type}")
-            click.echo(f"  Keys count: {len(magnet_run.get_keys())}")
-
-            info_dict = magnet_data.get_info()
-            click.echo(f"  Filename: {info_dict['filename']}")
-            click.echo(
-                f"  Data shape: {info_dict.get('metadata', {}).get('shape', 'N/A')}"
+    show_one = functools.partial(
+        _show_one,
+        housing=housing,
+        site=site,
+        list_keys=list_keys,
+        convert=convert,
+        debug=debug,
+    )
+    for lines in map_files(show_one, files, jobs):
+        _echo_lines(lines)
+
+
+def _show_one(file_path, housing, site, list_keys, convert, debug):
+    """Collect the show output of one file as (text, err) lines."""
+    lines = [(f"Processing: {file_path}", False)]
+
+    try:
+        magnet_data, magnet_run = load_magnet_data(file_path, housing, site)
+
+        if debug:
+            lines.append((f"  Debug: File extension: {Path(file_path).suffix}", False))
+            lines.append((f"  Debug: Format type: {magnet_data.format_type}", False))
+
+        lines.append((f"  Housing: {magnet_run.housing}", False))
+        lines.append((f"  Site: {magnet_run.site}", False))
+        lines.append((f"  Format: {magnet_data.format_type}", False))
+        lines.append((f"  Keys count: {len(magnet_run.get_keys())}", False))
+
+        info_dict = magnet_data.get_info()
+        lines.append((f"  Filename: {info_dict['filename']}", False))
+        lines.append(
+            (
+                f"  Data shape: {info_dict.get('metadata', {}).get('shape', 'N/A')}",
+                False,
             )
+        )
 
-            if list_keys:
-                click.echo("  Available keys:")
-                for key in magnet_run.get_keys():
-                    click.echo(f"    {key}")
+        if list_keys:
+            lines.append(("  Available keys:", False))
+            for key in magnet_run.get_keys():
+                lines.append((f"    {key}", False))
 
-            if convert:
-                _convert_file(magnet_data, file_path)
+        if convert:
+            messages = _convert_file(magnet_data, file_path)
+            lines.extend((text, False) for text in messages)
 
-        except Exception as e:
-            handle_error(e, debug, file_path)
+    except Exception as e:
+        lines.append((f"  Error processing {file_path}: {e}", True))
+        if debug:
+            lines.append((traceback.format_exc(), True))
+
+    return lines
 
 
 @info_commands.command()
 @click.pass_context
 def formats(ctx):
     """List supported file formats and their characteristics."""
-    click.echo("Supported File Formats:")
-    click.echo("=" * 50)
+    lines = ["Supported File Formats:", "=" * 50]
 
     # detector = FormatDetector()
 
     fregistry = get_format_registry()
     for format_name in fregistry.get_supported_formats():
-        reader_class = fregistry.get_reader(format_name)
-        reader_instance = reader_class()
+        reader_instance = fregistry.get_reader_instance(format_name)
 
-        click.echo(f"\n{format_name.upper()}")
-        click.echo(f"  Extensions: {', '.join(reader_instance.supported_extensions)}")
-        click.echo(
+        lines.append(f"\n{format_name.upper()}")
+        lines.append(f"  Extensions: {', '.join(reader_instance.supported_extensions)}")
+        lines.append(
             f"  Description: {reader_instance.__doc__ or 'No description available'}"
         )
 
         data_handler_class = fregistry.get_data_handler(format_name)
-        click.echo(f"  Handler: {data_handler_class.__name__}")
+        lines.append(f"  Handler: {data_handler_class.__name__}")
+
+    click.echo("\n".join(lines))
 
 
 @info_commands.command()
 @click.argument("files", nargs=-1, type=click.Path(exists=True), required=True)
+@click.option(
+    "--jobs",
+    "-j",
+    type=int,
+    default=None,
+    help="Number of worker processes (default: number of CPUs)",
+)
 @click.pass_context
-def validate(ctx, files):
+def validate(ctx, files, jobs):
     """Validate files and show detected formats."""
-    detector = FormatDetector()
-
     click.echo("File Format Validation:")
     click.echo("=" * 50)
 
-    for file_path in files:
-        file_path = Path(file_path)
-        detected_format = detector.detect_format(file_path)
+    for lines in map_files(_validate_one, files, jobs):
+        _echo_lines(lines)
 
-        if detected_format:
-            click.echo(f"✓ {file_path.name}: {detected_format}")
 
-            try:
-                reader = detector.get_reader_for_file(file_path)
-                file_data = reader.read(file_path)
-                metadata = file_data.get("metadata", {})
+def _validate_one(file_path):
+    """Collect the validate output of one file as (text, err) lines."""
+    file_path = Path(file_path)
+    # Extensions claimed by a single reader (.tdms) skip content sniffing;
+    # shared ones (.txt) fall back to the detector
+    reader = _unique_extension_readers().get(file_path.suffix.lower())
+    if reader is None:
+        # Read the header once and let every reader sniff the same bytes
+        try:
+            header = read_header(file_path)
+        except OSError:
+            header = None
+        reader = _detector().get_reader_for_file(file_path, header)
 
-                if "shape" in metadata:
-                    click.echo(f"    Shape: {metadata['shape']}")
-                if "columns" in metadata:
-                    click.echo(f"    Columns: {len(metadata['columns'])}")
+    if not reader:
+        return [(f"✗ {file_path.name}: Unknown format", False)]
 
-            except Exception as e:
-                click.echo(f"    Warning: Could not read file details: {e}")
+    lines = [(f"✓ {file_path.name}: {reader.format_name}", False)]
+    try:
+        file_data = reader.read(file_path)
+        metadata = file_data.get("metadata", {})
+
+        if "shape" in metadata:
+            lines.append((f"    Shape: {metadata['shape']}", False))
+        if "columns" in metadata:
+            lines.append((f"    Columns: {len(metadata['columns'])}", False))
+
+    except Exception as e:
+        lines.append((f"    Warning: Could not read file details: {e}", False))
+
+    return lines
+
+
+def _echo_lines(lines):
+    """Echo (text, err) lines collected by a worker, one write per stream."""
+    for err, run in groupby(lines, key=itemgetter(1)):
+        click.echo("\n".join(text for text, _ in run), err=err)
+
+
+@lru_cache(maxsize=1)
+def _detector():
+    """Return the FormatDetector shared by all files of a process."""
+    return FormatDetector()
+
+
+@lru_cache(maxsize=1)
+def _unique_extension_readers():
+    """Map each extension handled by exactly one reader to that reader."""
+    fregistry = get_format_registry()
+    claims = {}
+    for format_name in fregistry.get_supported_formats():
+        reader = fregistry.get_reader_instance(format_name)
+        for extension in reader.supported_extensions:
+            claims.setdefault(extension, []).append(reader)
+    return {ext: readers[0] for ext, readers in claims.items() if len(readers) == 1}
+
+
+_PLAIN_NAME = re.compile(r"[A-Za-z0-9_./-]+")
+
+
+def _write_csv(data, output_path, chunksize=100_000):
+    """Write a DataFrame to CSV in row chunks through a single buffered file."""
+    # Row slicing and to_csv take pandas' slow path on MultiIndex frames
+    if not isinstance(data.index, pd.RangeIndex):
+        data = data.reset_index(drop=True)
+
+    # Numeric cells never need quoting, so skip the quoting checks for them
+    options = {"index": False}
+    if all(is_numeric_dtype(dtype) for dtype in data.dtypes):
+        options["quoting"] = csv.QUOTE_NONE
+
+    with open(output_path, "w", buffering=4 * 1024 * 1024, newline="") as f:
+        # Plain column names need no quoting, so skip pandas' header writer
+        if all(isinstance(c, str) and _PLAIN_NAME.fullmatch(c) for c in data.columns):
+            f.write(",".join(data.columns) + os.linesep)
         else:
-            click.echo(f"✗ {file_path.name}: Unknown format")
+            data.iloc[:0].to_csv(f, index=False)  # header only
+        for start in range(0, len(data), chunksize):
+            data.iloc[start : start + chunksize].to_csv(f, header=False, **options)
 
 
 def _convert_file(magnet_data, file_path):
-    """Helper function to convert files to CSV."""
+    """Helper function to convert files to CSV, returning status messages."""
+    messages = []
+    stem = os.path.splitext(os.fspath(file_path))[0]
     if magnet_data.format_type in ["pandas", "pupitre", "bprofile"]:
-        output_path = Path(file_path).with_suffix(".csv")
+        output_path = f"{stem}.csv"
         DataWriter.to_csv(magnet_data, output_path)
-        click.echo(f"  Converted to: {output_path}")
+        messages.append(f"  Converted to: {output_path}")
 
     elif magnet_data.format_type == "pigbrother":
         # Convert each group separately for pigbrother format
-        all_keys = magnet_data.keys
-        groups = {}
-
-        # Group keys by their group name (everything before the first '/')
-        for key in all_keys:
-            if "/" in key:
-                group_name = key.split("/")[0]
-                if group_name not in groups:
-                    groups[group_name] = []
-                groups[group_name].append(key)
-            else:
-                # Keys without group go to 'main' group
-                if "main" not in groups:
-                    groups["main"] = []
-                groups["main"].append(key)
-
-        # Convert each group to a separate CSV file
-        base_path = Path(file_path).with_suffix("")
-        for group_name, group_keys in groups.items():
+        groups = defaultdict(list)
+
+        # Group keys by their group name (everything before the first '/');
+        # keys without group go to 'main' group
+        for key in magnet_data.keys:
+            group_name, sep, _ = key.partition("/")
+            groups[group_name if sep else "main"].append(key)
+
+        # Convert each group to a separate CSV file; the writes are I/O bound
+        # and independent, so they overlap in threads
+        def write_group(item):
+            group_name, group_keys = item
             try:
-                group_data = magnet_data.get_data(group_keys)
-                output_path = base_path.with_suffix(f"_{group_name}.csv")
-                group_data.to_csv(output_path, index=False)
-                click.echo(f"  Converted group '{group_name}' to: {output_path}")
+                output_path = f"{stem}_{group_name}.csv"
+                _write_csv(magnet_data.get_data(group_keys), output_path)
+                return f"  Converted group '{group_name}' to: {output_path}"
             except Exception as e:
-                click.echo(f"  Warning: Could not convert group '{group_name}': {e}")
+                return f"  Warning: Could not convert group '{group_name}': {e}"
+
+        with ThreadPoolExecutor(max_workers=min(len(groups), 4) or 1) as executor:
+            messages.extend(executor.map(write_group, groups.items()))
 
     else:
         # Generic conversion for other formats
         try:
-            output_path = Path(file_path).with_suffix(".csv")
+            output_path = f"{stem}.csv"
             data = magnet_data.get_data()
-            data.to_csv(output_path, index=False)
-            click.echo(f"  Converted to: {output_path}")
+            _write_csv(data, output_path)
+            messages.append(f"  Converted to: {output_path}")
         except Exception as e:
-            click.echo(f"  Error converting file: {e}")
+            messages.append(f"  Error converting file: {e}")
+
+    return messages
@@ -5,73 +5,11 @@ Complete CLI definition with updated field management
 """
 
 import click
-from .info import info_commands
-from .plotting import plotting_commands
-from .analysis import analysis_commands
-from .processing import processing_commands
-from .selection import selection_commands
-from .etl import etl_commands
-from .formats import formats  # CORRECTED: Use new formats CLI
+import importlib
+import logging
 
 
-@click.group()
-@click.option('--debug', is_flag=True, help='Enable debug mode')
-@click.pass_context
-def cli(ctx, debug):
-    """MagnetRun CLI - Tools for processing and analyzing magnet measurement data.
-
-    Available command groups:
-
-    \b
-    info      - File information and validation commands
-    plot      - Visualization and plotting commands
-    stats     - Statistical analysis and feature detection
-    add       - Data processing and formula commands
-    select    - Data extraction and conversion commands
-    etl       - ETL operations for format-specific transformations
-    formats   - Format management and validation commands (JSON-based)
-    
-    Use 'magnetrun COMMAND --help' for detailed help on each command group.
-    
-    The field management system now uses JSON configuration files for
-    all LNCMI measurement formats (pupitre, pigbrother, bprofile).
-    """
-    # Ensure that ctx.obj exists and is a dict (in case `cli()` is called by way of the repl)
-    ctx.ensure_object(dict)
-    ctx.obj["DEBUG"] = debug
-
-
-# Register all command groups
-cli.add_command(info_commands)
-cli.add_command(plotting_commands)
-cli.add_command(analysis_commands)
-cli.add_command(processing_commands)
-cli.add_command(selection_commands)
-cli.add_command(etl_commands)
-cli.add_command(formats)  # CORRECTED: Use new formats CLI
-
-
-@cli.command()
-def version():
-    """Show version information."""
-    try:
-        from .. import __version__
-        click.echo(f"MagnetRun CLI v{__version__}")
-    except ImportError:
-        click.echo("MagnetRun CLI (version unknown)")
-    
-    # Show field management version
-    try:
-        from ..core.fields import __field_management_version__
-        click.echo(f"Field Management System: v{__field_management_version__}")
-    except (ImportError, AttributeError):
-        click.echo("Field Management System: v2.1.0 (JSON-based)")
-
-
-@cli.command()
-def examples():
-    """Show usage examples with JSON-based field management."""
-    examples_text = """
+_EXAMPLES_TEXT = """
 MagnetRun CLI Usage Examples:
 
 File Information:
@@ -158,13 +96,9 @@ Key Improvements in Field Management:
   - Built-in definitions for pupitre, pigbrother, bprofile formats
   - Simplified workflow - edit JSON files directly
     """
-    click.echo(examples_text)
 
 
-@cli.command()
-def migrate_help():
-    """Show migration guide to JSON-based field system."""
-    migration_text = """
+_MIGRATE_TEXT = """
 Migration Guide: Complex → JSON-Based Field System
 
 OLD COMPLEX WORKFLOW:
@@ -234,13 +168,9 @@ BACKWARD COMPATIBILITY:
 - Existing data files work without changes
 - Field operations use the same API
     """
-    click.echo(migration_text)
 
 
-@cli.command()
-def formats_help():
-    """Show detailed help for JSON-based format management."""
-    formats_help_text = """
+_FORMATS_HELP_TEXT = """
 JSON-Based Format Management System
 
 JSON CONFIGURATION FILES:
@@ -304,7 +234,121 @@ SHARING CONFIGURATIONS:
 - Copy JSON files between installations
 - Export/import functionality available
     """
-    click.echo(formats_help_text)
+
+
+class _EchoHandler(logging.Handler):
+    """Print magnetrun log records through click.echo, warnings to stderr."""
+
+    def emit(self, record):
+        try:
+            click.echo(self.format(record), err=record.levelno >= logging.WARNING)
+        except Exception:
+            self.handleError(record)
+
+
+def _configure_logging(debug: bool) -> None:
+    """Set up the package logger only, leaving the root logger alone."""
+    logger = logging.getLogger("magnetrun")
+    logger.setLevel(logging.DEBUG if debug else logging.INFO)
+    logger.propagate = False
+    if not any(isinstance(h, _EchoHandler) for h in logger.handlers):
+        logger.addHandler(_EchoHandler())
+
+
+class LazyGroup(click.Group):
+    """Click group that imports its command groups only when they are used."""
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Command name -> "module:attribute" of the command object
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            module_name, attr = self.lazy_subcommands[cmd_name].rsplit(":", 1)
+            return getattr(importlib.import_module(module_name), attr)
+        return super().get_command(ctx, cmd_name)
+
+
+# Register all command groups
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "info": "magnetrun.cli.info:info_commands",
+        "plot": "magnetrun.cli.plotting:plotting_commands",
+        "stats": "magnetrun.cli.analysis:analysis_commands",
+        "add": "magnetrun.cli.processing:processing_commands",
+        "select": "magnetrun.cli.selection:selection_commands",
+        "etl": "magnetrun.cli.etl:etl_commands",
+        "formats": "magnetrun.cli.formats:formats",  # CORRECTED: Use new formats CLI
+    },
+)
+@click.option('--debug', is_flag=True, help='Enable debug mode')
+@click.pass_context
+def cli(ctx, debug):
+    """MagnetRun CLI - Tools for processing and analyzing magnet measurement data.
+
+    Available command groups:
+
+    \b
+    info      - File information and validation commands
+    plot      - Visualization and plotting commands
+    stats     - Statistical analysis and feature detection
+    add       - Data processing and formula commands
+    select    - Data extraction and conversion commands
+    etl       - ETL operations for format-specific transformations
+    formats   - Format management and validation commands (JSON-based)
+    
+    Use 'magnetrun COMMAND --help' for detailed help on each command group.
+    
+    The field management system now uses JSON configuration files for
+    all LNCMI measurement formats (pupitre, pigbrother, bprofile).
+    """
+    # Ensure that ctx.obj exists and is a dict (in case `cli()` is called by way of the repl)
+    ctx.ensure_object(dict)
+    ctx.obj["DEBUG"] = debug
+
+    # Per-file progress messages go through logging so they are only
+    # formatted when the level is enabled
+    _configure_logging(debug)
+
+
+@cli.command()
+def version():
+    """Show version information."""
+    try:
+        from .. import __version__
+        click.echo(f"MagnetRun CLI v{__version__}")
+    except ImportError:
+        click.echo("MagnetRun CLI (version unknown)")
+    
+    # Show field management version
+    try:
+        from ..core.fields import __field_management_version__
+        click.echo(f"Field Management System: v{__field_management_version__}")
+    except (ImportError, AttributeError):
+        click.echo("Field Management System: v2.1.0 (JSON-based)")
+
+
+@cli.command()
+def examples():
+    """Show usage examples with JSON-based field management."""
+    click.echo_via_pager(_EXAMPLES_TEXT)
+
+
+@cli.command()
+def migrate_help():
+    """Show migration guide to JSON-based field system."""
+    click.echo(_MIGRATE_TEXT)
+
+
+@cli.command()
+def formats_help():
+    """Show detailed help for JSON-based format management."""
+    click.echo(_FORMATS_HELP_TEXT)
 
 
 def main():
@@ -2,15 +2,21 @@
 
 import click
 from pathlib import Path
-import matplotlib.pyplot as plt
 from .utils import load_magnet_data, add_time_column_if_needed, handle_error
-from ..visualization.plotters import DataPlotter
 
 @click.group(name='plot')
 def plotting_commands():
     """Visualization commands."""
     pass
 
+def _prepare_output_dir(output_dir):
+    """Create the output directory once and return it resolved, or None."""
+    if not output_dir:
+        return None
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir.resolve()
+
 @plotting_commands.command()
 @click.argument('files', nargs=-1, type=click.Path(exists=True), required=True)
 @click.option('--housing', default='M9', help='Housing type')
@@ -27,13 +33,14 @@ def plotting_commands():
 def show(ctx, files, housing, keys, x_key, key_vs_key, normalize, save, show, output_dir, grid, style):
     """Generate plots from data."""
     debug = ctx.obj.get('DEBUG', False)
+    # Imported here so loading this module does not pull in matplotlib
+    from ..visualization.plotters import DataPlotter
     
     if style != 'default':
+        import matplotlib.pyplot as plt
         plt.style.use(style)
     
-    if output_dir:
-        output_dir = Path(output_dir)
-        output_dir.mkdir(exist_ok=True)
+    output_dir = _prepare_output_dir(output_dir)
     
     for file_path in files:
         click.echo(f"Plotting: {file_path}")
@@ -74,10 +81,9 @@ def show(ctx, files, housing, keys, x_key, key_vs_key, normalize, save, show, ou
 def subplots(ctx, files, housing, keys, x_key, normalize, save, show, output_dir, cols):
     """Create subplot grid for multiple keys."""
     debug = ctx.obj.get('DEBUG', False)
+    from ..visualization.plotters import DataPlotter
     
-    if output_dir:
-        output_dir = Path(output_dir)
-        output_dir.mkdir(exist_ok=True)
+    output_dir = _prepare_output_dir(output_dir)
     
     for file_path in files:
         click.echo(f"Creating subplots for: {file_path}")
@@ -106,10 +112,9 @@ def subplots(ctx, files, housing, keys, x_key, normalize, save, show, output_dir
 def overview(ctx, files, housing, template, save, show, output_dir):
     """Create overview plot with predefined layout."""
     debug = ctx.obj.get('DEBUG', False)
+    from ..visualization.plotters import DataPlotter
     
-    if output_dir:
-        output_dir = Path(output_dir)
-        output_dir.mkdir(exist_ok=True)
+    output_dir = _prepare_output_dir(output_dir)
     
     for file_path in files:
         click.echo(f"Creating overview plot for: {file_path}")
@@ -137,12 +142,11 @@ def overview(ctx, files, housing, template, save, show, output_dir):
 def convert_units(ctx, files, housing, field_name, units, save, show, output_dir):
     """Create unit conversion comparison plots."""
     debug = ctx.obj.get('DEBUG', False)
+    from ..visualization.plotters import DataPlotter
     
     target_units = [unit.strip() for unit in units.split(',')]
     
-    if output_dir:
-        output_dir = Path(output_dir)
-        output_dir.mkdir(exist_ok=True)
+    output_dir = _prepare_output_dir(output_dir)
     
     for file_path in files:
         click.echo(f"Creating unit conversion plot for: {file_path}")
@@ -168,10 +172,9 @@ def convert_units(ctx, files, housing, field_name, units, save, show, output_dir
 def field_validation(ctx, files, housing, save, show, output_dir):
     """Create field validation summary plots."""
     debug = ctx.obj.get('DEBUG', False)
+    from ..visualization.plotters import DataPlotter
     
-    if output_dir:
-        output_dir = Path(output_dir)
-        output_dir.mkdir(exist_ok=True)
+    output_dir = _prepare_output_dir(output_dir)
     
     for file_path in files:
         click.echo(f"Creating field validation plot for: {file_path}")
@@ -197,10 +200,9 @@ def field_validation(ctx, files, housing, save, show, output_dir):
 def field_types(ctx, files, housing, save, show, output_dir):
     """Create field type distribution plots."""
     debug = ctx.obj.get('DEBUG', False)
+    from ..visualization.plotters import DataPlotter
     
-    if output_dir:
-        output_dir = Path(output_dir)
-        output_dir.mkdir(exist_ok=True)
+    output_dir = _prepare_output_dir(output_dir)
     
     for file_path in files:
         click.echo(f"Creating field type distribution plot for: {file_path}")
@@ -1,10 +1,24 @@
 """Data processing and formula commands."""
 
+import os
+from itertools import chain
+
 import click
-from pathlib import Path
-from .utils import load_magnet_data, add_time_column_if_needed, handle_error
+import numpy as np
+from pandas.api.types import is_numeric_dtype
+from .utils import (
+    load_magnet_data,
+    iter_magnet_data_chunks,
+    add_time_column_if_needed,
+    handle_error,
+)
 from ..visualization.plotters import DataPlotter
 
+try:
+    import numexpr
+except ImportError:  # pragma: no cover - depends on the environment
+    numexpr = None
+
 
 @click.group(name="add")
 def processing_commands():
@@ -87,15 +101,55 @@ def formula(
 @click.option("--max-value", type=float, help="Maximum value threshold")
 @click.option("--exclude-zeros", is_flag=True, help="Exclude zero values")
 @click.option("--sample-rate", type=int, help="Sample every N-th point")
+@click.option(
+    "--chunksize",
+    type=click.IntRange(min=1),
+    help="Stream the input in chunks of N rows (formats that cannot stream are loaded whole)",
+)
 @click.pass_context
-def filter(ctx, files, housing, keys, min_value, max_value, exclude_zeros, sample_rate):
+def filter(
+    ctx,
+    files,
+    housing,
+    keys,
+    min_value,
+    max_value,
+    exclude_zeros,
+    sample_rate,
+    chunksize,
+):
     """Filter data based on value criteria."""
     debug = ctx.obj.get("DEBUG", False)
 
     for file_path in files:
         click.echo(f"Filtering: {file_path}")
+        output_path = f"{os.path.splitext(os.fspath(file_path))[0]}_filtered.csv"
 
         try:
+            if chunksize:
+                chunks = _data_chunks(file_path, chunksize, housing, debug)
+                try:
+                    result = _filter_chunks(
+                        chunks,
+                        output_path,
+                        keys,
+                        min_value,
+                        max_value,
+                        exclude_zeros,
+                        sample_rate,
+                    )
+                finally:
+                    chunks.close()
+
+                if result is None:
+                    click.echo("    Warning: No valid filter keys found")
+                    continue
+
+                original_length, kept = result
+                click.echo(f"    Filtered from {original_length} to {kept} rows")
+                click.echo(f"    Saved filtered data: {output_path}")
+                continue
+
             magnet_data, magnet_run = load_magnet_data(file_path, housing)
             add_time_column_if_needed(magnet_data, debug)
 
@@ -103,29 +157,14 @@ def filter(ctx, files, housing, keys, min_value, max_value, exclude_zeros, sampl
             original_length = len(data)
 
             # Apply filters
-            if keys:
-                filter_keys = [k for k in keys if k in data.columns]
-                if not filter_keys:
-                    click.echo(f"    Warning: No valid filter keys found")
-                    continue
-            else:
-                # Use all numeric columns
-                filter_keys = data.select_dtypes(include=["number"]).columns.tolist()
-
-            mask = True
-
-            if min_value is not None:
-                for key in filter_keys:
-                    mask = mask & (data[key] >= min_value)
-
-            if max_value is not None:
-                for key in filter_keys:
-                    mask = mask & (data[key] <= max_value)
-
-            if exclude_zeros:
-                for key in filter_keys:
-                    mask = mask & (data[key] != 0)
+            filter_keys = _select_filter_keys(data, keys)
+            if keys and not filter_keys:
+                click.echo("    Warning: No valid filter keys found")
+                continue
 
+            mask = _filter_mask(
+                data[filter_keys].to_numpy(), min_value, max_value, exclude_zeros
+            )
             filtered_data = data[mask]
 
             if sample_rate and sample_rate > 1:
@@ -136,7 +175,6 @@ def filter(ctx, files, housing, keys, min_value, max_value, exclude_zeros, sampl
             )
 
             # Save filtered data
-            output_path = Path(file_path).with_suffix("_filtered.csv")
             filtered_data.to_csv(output_path, index=False)
             click.echo(f"    Saved filtered data: {output_path}")
 
@@ -144,6 +182,105 @@ def filter(ctx, files, housing, keys, min_value, max_value, exclude_zeros, sampl
             handle_error(e, debug, file_path)
 
 
+def _select_filter_keys(data, keys):
+    """Return the requested keys present in data, or all numeric columns."""
+    if keys:
+        return [k for k in keys if k in data.columns]
+    return data.select_dtypes(include=["number"]).columns.tolist()
+
+
+def _data_chunks(file_path, chunksize, housing, debug):
+    """Yield a file's data chunk by chunk, prepared as filter prepares it whole."""
+    for magnet_data, magnet_run in iter_magnet_data_chunks(
+        file_path, chunksize, housing
+    ):
+        add_time_column_if_needed(magnet_data, debug)
+        yield magnet_data.get_data()
+
+
+def _filter_chunks(
+    chunks, output_path, keys, min_value, max_value, exclude_zeros, sample_rate
+):
+    """Filter DataFrame chunks into one CSV, returning (rows read, rows kept).
+
+    Filter keys are resolved from the header of the first chunk. Without
+    explicit keys, the numeric columns of the first chunk are used and must
+    stay numeric in every later chunk. Returns None, writing nothing, when
+    none of the explicit keys exist.
+    """
+    chunks = iter(chunks)
+    first = next(chunks, None)
+    if first is None:
+        filter_keys = []
+    else:
+        filter_keys = _select_filter_keys(first, keys)
+        if keys and not filter_keys:
+            return None
+        chunks = chain([first], chunks)
+
+    total = passed = kept = 0
+    with open(output_path, "w", buffering=4 * 1024 * 1024, newline="") as f:
+        for chunk in chunks:
+            if not keys and total:
+                mixed = [k for k in filter_keys if not is_numeric_dtype(chunk[k])]
+                if mixed:
+                    raise ValueError(
+                        f"Columns {mixed} are not numeric past row {total}; "
+                        "pass --keys or drop --chunksize"
+                    )
+
+            mask = _filter_mask(
+                chunk[filter_keys].to_numpy(), min_value, max_value, exclude_zeros
+            )
+            filtered = chunk[mask]
+
+            if sample_rate and sample_rate > 1:
+                # Keep the every-N-th stride aligned across chunk boundaries
+                offset = -passed % sample_rate
+                passed += len(filtered)
+                filtered = filtered.iloc[offset::sample_rate]
+
+            filtered.to_csv(f, header=(total == 0), index=False)
+            total += len(chunk)
+            kept += len(filtered)
+
+    return total, kept
+
+
+def _filter_mask(values, min_value, max_value, exclude_zeros):
+    """Return the rows of a 2D array whose every column passes all thresholds.
+
+    The predicates are fused into one pass, evaluated by NumExpr in
+    cache-sized blocks when it is installed.
+    """
+    conditions = []
+    operands = {"values": values}
+    if min_value is not None:
+        conditions.append("(values >= lo)")
+        operands["lo"] = min_value
+    if max_value is not None:
+        conditions.append("(values <= hi)")
+        operands["hi"] = max_value
+    if exclude_zeros:
+        conditions.append("(values != 0)")
+
+    if not conditions:
+        return np.ones(len(values), dtype=bool)
+
+    if numexpr is not None and values.dtype.kind in "fi":
+        passed = numexpr.evaluate(" & ".join(conditions), local_dict=operands)
+    else:
+        passed = np.ones(values.shape, dtype=bool)
+        if min_value is not None:
+            passed &= values >= min_value
+        if max_value is not None:
+            passed &= values <= max_value
+        if exclude_zeros:
+            passed &= values != 0
+
+    return passed.all(axis=1)
+
+
 def _compute_derived_quantities(magnet_data):
     """Compute derived quantities like water density."""
     try:
@@ -1,6 +1,9 @@
 """Data extraction and conversion commands."""
 
+import os
+
 import click
+import numpy as np
 from pathlib import Path
 from .utils import load_magnet_data, add_time_column_if_needed, handle_error
 from ..io.writers import DataWriter
@@ -30,11 +33,16 @@ def extract(ctx, files, housing, time, time_range, key, key_pairs, convert):
             magnet_data, magnet_run = load_magnet_data(file_path, housing)
             add_time_column_if_needed(magnet_data, debug)
             
+            # The time extractors need every column: materialize them once.
+            # The key extractors load only the columns they select.
+            if time or time_range:
+                data = magnet_data.get_data()
+            
             if time:
-                _extract_at_times(magnet_data, time, file_path)
+                _extract_at_times(data, time, file_path)
             
             if time_range:
-                _extract_time_ranges(magnet_data, time_range, file_path)
+                _extract_time_ranges(data, time_range, file_path)
             
             if key:
                 _extract_keys_vs_time(magnet_data, key, file_path)
@@ -48,40 +56,68 @@ def extract(ctx, files, housing, time, time_range, key, key_pairs, convert):
         except Exception as e:
             handle_error(e, debug, file_path)
 
-def _extract_at_times(magnet_data, time_options, file_path):
+def _extract_at_times(data, time_options, file_path):
     """Extract data at specific times."""
     click.echo("  Extracting data at specific times...")
-    for time_list in time_options:
-        times = [float(t) for t in time_list.split(';')]
+    times = [float(t) for time_list in time_options for t in time_list.split(';')]
+    
+    if 't' not in data.columns:
+        click.echo("    Warning: No time column found for time extraction")
+        return
+    
+    stem = os.path.splitext(os.fspath(file_path))[0]
+    positions = _nearest_positions(data['t'].to_numpy(dtype=float), np.asarray(times, dtype=float))
+    if positions is None:
+        click.echo("    Warning: No valid time values found for time extraction")
+        return
+    
+    for time_val, position in zip(times, positions):
+        selected_data = data.iloc[[position]]
         
-        for time_val in times:
-            data = magnet_data.get_data()
-            
-            if 't' in data.columns:
-                closest_idx = (data['t'] - time_val).abs().idxmin()
-                selected_data = data.iloc[[closest_idx]]
-                
-                output_path = Path(file_path).with_suffix(f'_at_{time_val:.3f}s.csv')
-                selected_data.to_csv(output_path, sep='\t', index=False, header=True)
-                click.echo(f"    Saved: {output_path}")
-            else:
-                click.echo("    Warning: No time column found for time extraction")
+        output_path = f'{stem}_at_{time_val:.3f}s.csv'
+        selected_data.to_csv(output_path, sep='\t', index=False, header=True)
+        click.echo(f"    Saved: {output_path}")
 
-def _extract_time_ranges(magnet_data, time_range_options, file_path):
+def _nearest_positions(t, targets):
+    """Return the position in t closest to each target, first one on ties.
+    
+    Matches (t - target).abs().idxmin() on a RangeIndex for every target,
+    NaN times being skipped. Returns None when t has no valid value.
+    """
+    valid = np.flatnonzero(~np.isnan(t))
+    if len(valid) == 0:
+        return None
+    order = valid[np.argsort(t[valid], kind='stable')]
+    sorted_t = t[order]
+    
+    # Keep the first occurrence of each repeated time (stable sort: lowest position)
+    first = np.empty(len(sorted_t), dtype=bool)
+    first[0] = True
+    np.not_equal(sorted_t[1:], sorted_t[:-1], out=first[1:])
+    order, sorted_t = order[first], sorted_t[first]
+    
+    # Compare each target with its neighbours on both sides of the insertion point
+    idx = np.searchsorted(sorted_t, targets, side='left').clip(1, len(sorted_t) - 1)
+    left, right = order[idx - 1], order[idx]
+    left_gap = np.abs(targets - sorted_t[idx - 1])
+    right_gap = np.abs(sorted_t[idx] - targets)
+    use_left = (left_gap < right_gap) | ((left_gap == right_gap) & (left < right))
+    return np.where(use_left, left, right)
+
+def _extract_time_ranges(data, time_range_options, file_path):
     """Extract data in time ranges."""
     click.echo("  Extracting data in time ranges...")
+    stem = os.path.splitext(os.fspath(file_path))[0]
     for time_range in time_range_options:
         start_time, end_time = time_range.split(';')
         start_time = float(start_time.replace(':', '-'))
         end_time = float(end_time.replace(':', '-'))
         
-        data = magnet_data.get_data()
-        
         if 't' in data.columns:
             mask = (data['t'] >= start_time) & (data['t'] <= end_time)
             selected_data = data[mask]
             
-            output_path = Path(file_path).with_suffix(f'_from_{start_time:.1f}_to_{end_time:.1f}.csv')
+            output_path = f'{stem}_from_{start_time:.1f}_to_{end_time:.1f}.csv'
             selected_data.to_csv(output_path, sep='\t', index=False, header=True)
             click.echo(f"    Saved: {output_path}")
         else:
@@ -90,21 +126,23 @@ def _extract_time_ranges(magnet_data, time_range_options, file_path):
 def _extract_keys_vs_time(magnet_data, key_options, file_path):
     """Extract specific keys vs time."""
     click.echo("  Extracting specific keys...")
+    stem = os.path.splitext(os.fspath(file_path))[0]
+    available = set(magnet_data.keys)
     for key_list in key_options:
         selected_keys = key_list.split(';') if ';' in key_list else [key_list]
         
         # Always include time if not present
-        if 't' not in selected_keys and 't' in magnet_data.keys:
+        if 't' not in selected_keys and 't' in available:
             selected_keys.insert(0, 't')
         
         # Validate keys exist
-        valid_keys = [k for k in selected_keys if k in magnet_data.keys]
+        valid_keys = [k for k in selected_keys if k in available]
         
         if valid_keys:
             selected_data = magnet_data.get_data(valid_keys)
             
             key_name = '_'.join([k for k in valid_keys if k != 't'])
-            output_path = Path(file_path).with_suffix(f'_{key_name}_vs_Time.csv')
+            output_path = f'{stem}_{key_name}_vs_Time.csv'
             
             selected_data.to_csv(output_path, sep='\t', index=False, header=True)
             click.echo(f"    Saved: {output_path}")
@@ -114,6 +152,8 @@ def _extract_keys_vs_time(magnet_data, key_options, file_path):
 def _extract_key_pairs(magnet_data, key_pairs_options, file_path):
     """Extract key pairs."""
     click.echo("  Extracting key pairs...")
+    stem = os.path.splitext(os.fspath(file_path))[0]
+    available = set(magnet_data.keys)
     for pair_list in key_pairs_options:
         # Support both comma-separated pairs and single pairs
         if ',' in pair_list:
@@ -125,13 +165,13 @@ def _extract_key_pairs(magnet_data, key_pairs_options, file_path):
             if ';' in pair:
                 key1, key2 = pair.split(';', 1)
                 
-                if key1 in magnet_data.keys and key2 in magnet_data.keys:
+                if key1 in available and key2 in available:
                     pair_data = magnet_data.get_data([key1, key2])
                     
                     # Remove zero values
                     pair_data = pair_data[(pair_data[key1] != 0) & (pair_data[key2] != 0)]
                     
-                    output_path = Path(file_path).with_suffix(f'_{key1}_{key2}.csv')
+                    output_path = f'{stem}_{key1}_{key2}.csv'
                     pair_data.to_csv(output_path, sep='\t', index=False, header=False)
                     click.echo(f"    Saved pair: {output_path}")
                 else:
@@ -1,8 +1,9 @@
 """Common utilities for CLI commands."""
 
 import click
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Tuple
+from typing import Iterator, Optional, Tuple
 
 # FIXED: Import directly from modules instead of top-level package
 from ..core.magnet_data import MagnetData
@@ -18,6 +19,29 @@ def load_magnet_data(
     return magnet_data, magnet_run
 
 
+def iter_magnet_data_chunks(
+    file_path: str, chunksize: int, housing: str = "M9", site: str = ""
+) -> Iterator[Tuple[MagnetData, MagnetRun]]:
+    """Load magnet data chunk by chunk, as load_magnet_data loads it whole."""
+    for magnet_data in MagnetData.iter_chunks(file_path, chunksize):
+        yield magnet_data, MagnetRun(housing, site, magnet_data)
+
+
+def map_files(func, items, jobs: Optional[int] = None, chunksize: int = 1) -> Iterator:
+    """Apply func to each item, in worker processes when there are several.
+
+    Runs inline when jobs is 1 or there is a single item, which avoids the
+    process start-up and pickling costs. Results are yielded in input
+    order as the workers finish.
+    """
+    if jobs == 1 or len(items) <= 1:
+        yield from map(func, items)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(func, items, chunksize=chunksize)
+
+
 def add_time_column_if_needed(magnet_data: MagnetData, debug: bool = False) -> None:
     """Add time column if needed and available."""
     if hasattr(magnet_data, "_add_time_if_needed"):
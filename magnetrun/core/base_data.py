@@ -55,6 +55,10 @@ class BaseData(ABC):
         """Get data for specified keys - must be implemented by subclasses."""
         pass
 
+    def get_dtypes(self) -> pd.Series:
+        """Get the dtype of every key - shared implementation."""
+        return self.get_data().dtypes
+
     def validate_keys(self, keys: Union[str, List[str]]) -> List[str]:
         """Validate that keys exist in the dataset - shared implementation."""
         if isinstance(keys, str):
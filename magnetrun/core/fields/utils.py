@@ -153,7 +153,8 @@ def validate_format_definition(format_def) -> dict:
         "warnings": warnings,
         "total_fields": len(format_def.fields),
         "field_types": {
-            ft.value: len(format_def.get_fields_by_type(ft)) for ft in FieldType
+            ft.value: len(fields_of_type)
+            for ft, fields_of_type in format_def.group_fields_by_type().items()
         },
     }
 
@@ -189,8 +190,7 @@ def create_field_summary(format_def) -> dict:
     }
 
     # Count by type
-    for field_type in FieldType:
-        fields_of_type = format_def.get_fields_by_type(field_type)
+    for field_type, fields_of_type in format_def.group_fields_by_type().items():
         if fields_of_type:
             summary["by_type"][field_type.value] = {
                 "count": len(fields_of_type),
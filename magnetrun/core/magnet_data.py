@@ -1,13 +1,14 @@
 """Main MagnetData class with updated field management integration."""
 
-from typing import Union, Optional, Tuple, Any, List
+from contextlib import closing
+from typing import Iterator, Union, Optional, Tuple, Any, List
 import pandas as pd
 import numpy as np
 from pathlib import Path
 from .base_data import BaseData
 
 # CORRECTED: Import from new locations
-from ..formats import FormatRegistry, FormatDefinition
+from ..formats import FormatRegistry, FormatDefinition, get_format_registry
 from ..core.fields import Field, FieldType, create_format_config_from_data
 
 from ..exceptions import FileFormatError
@@ -24,11 +25,15 @@ class MagnetData:
     ):
         self._data_handler = data_handler
         self._format_name = format_name
-        self._field_registry = field_registry or FormatRegistry()
+        self._field_registry = field_registry or get_format_registry()
 
         # Get or create format definition
         self._format_def = self._field_registry.get_format_definition(format_name)
         if not self._format_def:
+            if field_registry is None:
+                # Keep fields guessed from this file out of the shared registry
+                self._field_registry = FormatRegistry()
+
             # Create basic format definition from data keys if not found
             self._format_def = create_format_config_from_data(
                 self._data_handler.keys, format_name
@@ -37,9 +42,16 @@ class MagnetData:
 
     @classmethod
     def from_file(
-        cls, filepath: Union[str, Path], field_config: Optional[Union[str, Path]] = None
+        cls,
+        filepath: Union[str, Path],
+        field_config: Optional[Union[str, Path]] = None,
+        nrows: Optional[int] = None,
     ) -> "MagnetData":
-        """Create MagnetData by auto-detecting file format."""
+        """Create MagnetData by auto-detecting file format.
+
+        If nrows is given, only the first nrows rows are loaded, which is
+        enough for schema and sample-based checks on large files.
+        """
         filepath = Path(filepath)
 
         if not filepath.exists():
@@ -47,7 +59,6 @@ class MagnetData:
 
         # Import here to avoid circular imports
         from ..io.format_detector import FormatDetector
-        from ..formats.registry import get_format_registry
 
         # Detect format
         detector = FormatDetector()
@@ -58,8 +69,73 @@ class MagnetData:
 
         # Get reader and read file
         reader = detector.get_reader_for_file(filepath)
-        file_data = reader.read(filepath)
+        if nrows is None:
+            file_data = reader.read(filepath)
+        else:
+            file_data = reader.read(filepath, nrows=nrows)
+
+        # Load field configuration if provided
+        field_registry = None
+        if field_config:
+            field_registry = get_format_registry()
+            try:
+                custom_format = FormatDefinition.load_from_file(
+                    field_config, field_registry.ureg
+                )
+                field_registry.register_format_definition(custom_format)
+            except Exception as e:
+                print(f"Warning: Could not load field config {field_config}: {e}")
+
+        return cls._from_file_data(filepath, format_name, file_data, field_registry)
+
+    @classmethod
+    def iter_chunks(
+        cls, filepath: Union[str, Path], chunksize: int
+    ) -> Iterator["MagnetData"]:
+        """Yield MagnetData for consecutive chunks of chunksize rows of a file.
+
+        Formats whose reader cannot stream are yielded whole, as from_file
+        loads them.
+        """
+        filepath = Path(filepath)
+
+        if not filepath.exists():
+            raise FileNotFoundError(f"File not found: {filepath}")
+
+        # Import here to avoid circular imports
+        from ..io.format_detector import FormatDetector
+
+        reader = FormatDetector().get_reader_for_file(filepath)
+        if reader is None:
+            raise FileFormatError(f"Unknown file format: {filepath}")
 
+        try:
+            chunks = reader.read_chunks(filepath, chunksize)
+        except NotImplementedError:
+            yield cls.from_file(filepath)
+            return
+
+        with closing(chunks):
+            for chunk in chunks:
+                file_data = {
+                    "data": chunk,
+                    "metadata": {
+                        "columns": chunk.columns.tolist(),
+                        "shape": chunk.shape,
+                        "file_path": str(filepath),
+                    },
+                }
+                yield cls._from_file_data(filepath, reader.format_name, file_data)
+
+    @classmethod
+    def _from_file_data(
+        cls,
+        filepath: Path,
+        format_name: str,
+        file_data: dict,
+        field_registry: Optional[FormatRegistry] = None,
+    ) -> "MagnetData":
+        """Wrap what a reader returned in the data handler of its format."""
         # Create appropriate data handler
         handler_class = get_format_registry().get_data_handler(format_name)
 
@@ -83,20 +159,27 @@ class MagnetData:
                 f"Handler creation not implemented for format: {format_name}"
             )
 
-        # Create field registry
-        field_registry = get_format_registry()
+        return cls(handler, format_name, field_registry)
 
-        # Load field configuration if provided
-        if field_config:
-            try:
-                custom_format = FormatDefinition.load_from_file(
-                    field_config, field_registry.ureg
-                )
-                field_registry.register_format_definition(custom_format)
-            except Exception as e:
-                print(f"Warning: Could not load field config {field_config}: {e}")
+    @staticmethod
+    def peek_format(filepath: Union[str, Path]) -> Optional[str]:
+        """Detect the file format from its leading bytes, without parsing it.
 
-        return cls(handler, format_name, field_registry)
+        Returns None when no reader accepts the file, so callers can skip a
+        full parse.
+        """
+        # Import here to avoid circular imports
+        from ..io.base_reader import read_header
+        from ..io.format_detector import FormatDetector
+
+        filepath = Path(filepath)
+        try:
+            header = read_header(filepath)
+        except OSError:
+            return None
+
+        reader = FormatDetector().get_reader_for_file(filepath, header)
+        return reader.format_name if reader else None
 
     @classmethod
     def from_pandas(
@@ -313,6 +396,10 @@ class MagnetData:
         """Validate that keys exist in the dataset."""
         return self._data_handler.validate_keys(keys)
 
+    def get_dtypes(self) -> pd.Series:
+        """Get the dtype of every key."""
+        return self._data_handler.get_dtypes()
+
     def has_key(self, key: str) -> bool:
         """Check if a key exists in the dataset."""
         return key in self.keys
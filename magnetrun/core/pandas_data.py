@@ -32,6 +32,10 @@ class PandasBasedData(BaseData):
         selected_keys = self.validate_keys(key)
         return self.data[selected_keys].copy()
 
+    def get_dtypes(self) -> pd.Series:
+        """Get the dtype of every key without copying the data."""
+        return self.data.dtypes
+
     def _get_underlying_data(self) -> pd.DataFrame:
         """Get the underlying DataFrame."""
         return self.data
@@ -7,6 +7,8 @@ from typing import Dict, List, Optional, Union
 from dataclasses import dataclass
 import warnings
 
+from .._json import loads
+
 
 @dataclass
 class ConfigPaths:
@@ -155,8 +157,7 @@ class ConfigManager:
             return None
 
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                config_data = json.load(f)
+            config_data = loads(config_path.read_bytes())
 
             if use_cache:
                 self._config_cache[cache_key] = config_data
@@ -167,10 +168,29 @@ class ConfigManager:
             warnings.warn(f"Failed to load config {config_path}: {e}")
             return None
 
+    def has_format(self, format_name: str) -> bool:
+        """Check whether a format configuration file exists."""
+        return self.get_format_config_path(format_name).is_file()
+
+    def peek_metadata(self, config_type: str, config_name: str) -> Dict:
+        """Return the metadata section of a configuration, or an empty dict."""
+        config_data = self.load_config(config_type, config_name)
+        if not isinstance(config_data, dict):
+            return {}
+        return config_data.get("metadata") or {}
+
     def save_config(
-        self, config_type: str, config_name: str, config_data: Dict
+        self,
+        config_type: str,
+        config_name: str,
+        config_data: Dict,
+        overwrite: bool = True,
     ) -> bool:
-        """Save configuration to appropriate directory."""
+        """Save configuration to appropriate directory.
+
+        With overwrite=False the file is created exclusively and
+        FileExistsError is raised if it already exists.
+        """
         # Determine config path based on type
         if config_type == "format":
             config_path = self.get_format_config_path(config_name)
@@ -191,7 +211,8 @@ class ConfigManager:
             # Ensure parent directory exists
             config_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(config_path, "w", encoding="utf-8") as f:
+            mode = "w" if overwrite else "x"
+            with open(config_path, mode, encoding="utf-8") as f:
                 json.dump(config_data, f, indent=2, ensure_ascii=False)
 
             # Update cache
@@ -201,6 +222,8 @@ class ConfigManager:
             return True
 
         except Exception as e:
+            if isinstance(e, FileExistsError) and not overwrite:
+                raise
             warnings.warn(f"Failed to save config {config_path}: {e}")
             return False
 
@@ -1,11 +1,11 @@
 # magnetrun/formats/format_definition.py
 """Format definition class - separated to avoid circular imports."""
 
-import json
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any
 from pint import UnitRegistry
-from ..core.fields import Field  # Import Field to avoid circular import
+from .._json import dumps, loads
+from ..core.fields import Field, FieldType  # Import Field to avoid circular import
 
 # Global ureg instance
 _global_ureg = None
@@ -16,7 +16,11 @@ def get_global_ureg() -> UnitRegistry:
     global _global_ureg
     # print("get_global_ureg", _global_ureg, flush=True)
     if _global_ureg is None:
-        _global_ureg = UnitRegistry(system="SI")
+        # Pint caches its parsed unit definitions on disk between runs
+        try:
+            _global_ureg = UnitRegistry(system="SI", cache_folder=":auto:")
+        except Exception:
+            _global_ureg = UnitRegistry(system="SI")
         _global_ureg.define("percent = 0.01 = %")
         _global_ureg.define("ppm = 1e-6")
         _global_ureg.define("var = 1")  # For reactive power (VAr)
@@ -50,6 +54,13 @@ class FormatDefinition:
             field for field in self.fields.values() if field.field_type == field_type
         ]
 
+    def group_fields_by_type(self) -> Dict:
+        """Group fields by type in a single pass, with every FieldType as a key."""
+        groups = {field_type: [] for field_type in FieldType}
+        for field in self.fields.values():
+            groups[field.field_type].append(field)
+        return groups
+
     def convert_field_values(
         self, field_name: str, values: List[float], target_unit: str
     ) -> List[float]:
@@ -110,16 +121,18 @@ class FormatDefinition:
 
     def save_to_file(self, filepath: Union[str, Path]):
         """Save format definition to JSON file."""
-        filepath = Path(filepath)
-        with open(filepath, "w") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        Path(filepath).write_bytes(dumps(self.to_dict()))
+
+    @classmethod
+    def load_from_bytes(
+        cls, data: bytes, ureg: Optional[UnitRegistry] = None
+    ) -> "FormatDefinition":
+        """Create from the raw bytes of a JSON document."""
+        return cls.from_dict(loads(data), ureg)
 
     @classmethod
     def load_from_file(
         cls, filepath: Union[str, Path], ureg: Optional[UnitRegistry] = None
     ) -> "FormatDefinition":
         """Load format definition from JSON file."""
-        filepath = Path(filepath)
-        with open(filepath, "r") as f:
-            data = json.load(f)
-        return cls.from_dict(data, ureg)
+        return cls.load_from_bytes(Path(filepath).read_bytes(), ureg)
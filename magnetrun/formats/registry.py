@@ -1,6 +1,7 @@
 """Updated FormatRegistry that uses the centralized configuration system."""
 
-from typing import Dict, Type, List, Optional, Union
+import os
+from typing import Dict, Iterator, Type, List, Optional, Tuple, Union
 from pathlib import Path
 
 from ..core.base_data import BaseData
@@ -14,6 +15,7 @@ class FormatRegistry:
 
     def __init__(self, config_manager: Optional[ConfigManager] = None):
         self._readers: Dict[str, Type[BaseReader]] = {}
+        self._reader_instances: Dict[str, BaseReader] = {}
         self._data_handlers: Dict[str, Type[BaseData]] = {}
         self._format_definitions: Dict[str, FormatDefinition] = {}
         self.ureg = get_global_ureg()  # self._create_unit_registry()
@@ -62,6 +64,7 @@ class FormatRegistry:
     ):
         """Register a format with its reader and data handler."""
         self._readers[format_name] = reader_class
+        self._reader_instances.pop(format_name, None)
         self._data_handlers[format_name] = data_handler_class
 
     def register_format_definition(self, format_def: FormatDefinition):
@@ -97,12 +100,50 @@ class FormatRegistry:
         """Alias for get_format_definition for backward compatibility."""
         return self.get_format_definition(format_name)
 
+    def get_all_formats(self) -> Dict[str, Optional[FormatDefinition]]:
+        """Load all format definitions from the formats directory in one scan.
+
+        Returns a mapping of config name to definition, or None for files that
+        failed to load.
+        """
+        formats_dir = self.config_manager.config_paths.formats_dir
+        if not formats_dir.exists():
+            return {}
+
+        formats = {}
+        with os.scandir(formats_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+
+                format_name = entry.name[: -len(".json")]
+                format_def = self._format_definitions.get(format_name)
+                if format_def is None:
+                    try:
+                        format_def = FormatDefinition.load_from_bytes(
+                            Path(entry.path).read_bytes(), self.ureg
+                        )
+                        self._format_definitions[format_name] = format_def
+                    except Exception as e:
+                        print(
+                            f"Warning: Failed to load format definition '{format_name}': {e}"
+                        )
+                formats[format_name] = format_def
+
+        return formats
+
     def get_reader(self, format_name: str) -> Type[BaseReader]:
         """Get reader class for format."""
         if format_name not in self._readers:
             raise ValueError(f"Unknown format: {format_name}")
         return self._readers[format_name]
 
+    def get_reader_instance(self, format_name: str) -> BaseReader:
+        """Get the shared reader instance for format; readers are stateless."""
+        if format_name not in self._reader_instances:
+            self._reader_instances[format_name] = self.get_reader(format_name)()
+        return self._reader_instances[format_name]
+
     def get_data_handler(self, format_name: str) -> Type[BaseData]:
         """Get data handler class for format."""
         if format_name not in self._data_handlers:
@@ -120,6 +161,16 @@ class FormatRegistry:
         memory_formats = set(self._format_definitions.keys())
         return list(config_formats.union(memory_formats))
 
+    def items(self) -> Iterator[Tuple[str, Optional[FormatDefinition]]]:
+        """Iterate over (name, definition) pairs of all available formats.
+
+        Definitions come from the in-memory cache only; names whose config
+        failed to load yield None instead of being parsed again.
+        """
+        format_definitions = self._format_definitions
+        for format_name in self.list_formats():
+            yield format_name, format_definitions.get(format_name)
+
     def list_format_definitions(self) -> List[str]:
         """Alias for list_formats for backward compatibility."""
         return self.list_formats()
@@ -190,11 +241,12 @@ class FormatRegistry:
         if not import_dir.exists():
             return {}
 
+        existing_formats = set(self.list_formats())
         results = {}
         for json_file in import_dir.glob("*.json"):
             format_name = json_file.stem
 
-            if not overwrite and format_name in self.list_formats():
+            if not overwrite and format_name in existing_formats:
                 results[format_name] = False  # Already exists, not imported
                 continue
 
@@ -1,10 +1,26 @@
 
 """Abstract base class for file readers."""
 
+import io
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional
 from pathlib import Path
 
+# Number of leading bytes read once per file for format detection
+HEADER_SIZE = 65536
+
+
+def read_header(filepath: Path) -> bytes:
+    """Read the leading bytes of a file used for format detection."""
+    with open(filepath, "rb") as f:
+        return f.read(HEADER_SIZE)
+
+
+def header_lines(header: bytes, count: int) -> List[str]:
+    """Decode the first count lines of a header, like readline() would."""
+    text = io.StringIO(header.decode("utf-8", errors="replace"), newline=None)
+    return [text.readline() for _ in range(count)]
+
 class BaseReader(ABC):
     """Abstract base class for file readers."""
     
@@ -13,11 +29,32 @@ class BaseReader(ABC):
         """Check if this reader can handle the file."""
         pass
     
+    def can_read_header(self, filepath: Path, header: bytes) -> bool:
+        """Check if this reader can handle the file given its leading bytes.
+
+        Readers that can decide from the header override this; the default
+        falls back to can_read.
+        """
+        return self.can_read(filepath)
+
     @abstractmethod
-    def read(self, filepath: Path) -> Dict[str, Any]:
-        """Read the file and return structured data."""
+    def read(self, filepath: Path, nrows: Optional[int] = None) -> Dict[str, Any]:
+        """Read the file and return structured data.
+        
+        If nrows is given, only the first nrows rows of each table are read.
+        """
         pass
     
+    def read_chunks(self, filepath: Path, chunksize: int) -> Iterator[Any]:
+        """Read the file's table in consecutive DataFrames of chunksize rows.
+
+        Readers that can stream override this; the default raises
+        NotImplementedError.
+        """
+        raise NotImplementedError(
+            f"{self.format_name} files cannot be read in chunks"
+        )
+
     @property
     @abstractmethod
     def format_name(self) -> str:
@@ -2,8 +2,8 @@
 
 import pandas as pd
 from pathlib import Path
-from typing import Dict, Any, List
-from .base_reader import BaseReader
+from typing import Dict, Any, Iterator, List, Optional
+from .base_reader import BaseReader, header_lines, read_header
 
 
 class BprofileReader(BaseReader):
@@ -23,25 +23,31 @@ class BprofileReader(BaseReader):
             return False
 
         try:
-            # Read first few lines to check structure
-            with open(filepath, "r") as f:
-                first_line = f.readline().strip()
-
-            # Bprofile files have specific column structure
-            expected_columns = [
-                "Index",
-                "Position (mm)",
-                "Profile at Tr (%)",
-                "Profile at max (%)",
-            ]
-            return first_line.split(",") == expected_columns
+            return self.can_read_header(filepath, read_header(filepath))
         except Exception as e:
             return False
 
-    def read(self, filepath: Path) -> Dict[str, Any]:
+    def can_read_header(self, filepath: Path, header: bytes) -> bool:
+        """Check if file is a Bprofile format from its leading bytes."""
+        if filepath.suffix.lower() not in self.supported_extensions:
+            return False
+
+        # Read first line to check structure
+        first_line = header_lines(header, 1)[0].strip()
+
+        # Bprofile files have specific column structure
+        expected_columns = [
+            "Index",
+            "Position (mm)",
+            "Profile at Tr (%)",
+            "Profile at max (%)",
+        ]
+        return first_line.split(",") == expected_columns
+
+    def read(self, filepath: Path, nrows: Optional[int] = None) -> Dict[str, Any]:
         """Read Bprofile CSV file."""
         try:
-            data = pd.read_csv(filepath)
+            data = pd.read_csv(filepath, nrows=nrows)
 
             # Validate expected columns
             expected_columns = [
@@ -64,3 +70,7 @@ class BprofileReader(BaseReader):
             }
         except Exception as e:
             raise ValueError(f"Failed to read Bprofile file {filepath}: {e}")
+
+    def read_chunks(self, filepath: Path, chunksize: int) -> Iterator[pd.DataFrame]:
+        """Read Bprofile CSV file in chunks of chunksize rows."""
+        return pd.read_csv(filepath, chunksize=chunksize)
@@ -20,8 +20,7 @@ class FormatDetector:
 
         fregistry = get_format_registry()
         for format_name in fregistry.get_supported_formats():
-            reader_class = fregistry.get_reader(format_name)
-            self._readers.append(reader_class())
+            self._readers.append(fregistry.get_reader_instance(format_name))
 
     def detect_format(self, filepath: Path) -> Optional[str]:
         """Detect format of the file."""
@@ -30,9 +29,18 @@ class FormatDetector:
                 return reader.format_name
         return None
 
-    def get_reader_for_file(self, filepath: Path) -> Optional[BaseReader]:
-        """Get appropriate reader for the file."""
+    def get_reader_for_file(
+        self, filepath: Path, header: Optional[bytes] = None
+    ) -> Optional[BaseReader]:
+        """Get appropriate reader for the file.
+
+        If the leading bytes of the file are given as header, readers that
+        can decide from them do not reopen the file.
+        """
         for reader in self._readers:
-            if reader.can_read(filepath):
+            if header is None:
+                if reader.can_read(filepath):
+                    return reader
+            elif reader.can_read_header(filepath, header):
                 return reader
         return None
@@ -1,7 +1,7 @@
 """Reader for PigBrother TDMS files."""
 
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from .base_reader import BaseReader
 
 
@@ -31,9 +31,10 @@ class PigbrotherReader(BaseReader):
         except Exception as e:
             return False
 
-    def read(self, filepath: Path) -> Dict[str, Any]:
+    def read(self, filepath: Path, nrows: Optional[int] = None) -> Dict[str, Any]:
         """Read TDMS file."""
         try:
+            import pandas as pd
             from nptdms import TdmsFile
 
             keys = []
@@ -65,11 +66,21 @@ class PigbrotherReader(BaseReader):
                                 groups[gname][cname]["wf_start_offset"] = t_offset
 
                         # Get dataframe for this group
-                        data[gname] = group.as_dataframe(
-                            time_index=False,
-                            absolute_time=False,
-                            scaled_data=True,
-                        )
+                        if nrows is None:
+                            data[gname] = group.as_dataframe(
+                                time_index=False,
+                                absolute_time=False,
+                                scaled_data=True,
+                            )
+                        else:
+                            # Streaming mode only reads the requested slice;
+                            # Series pad short channels like as_dataframe
+                            data[gname] = pd.DataFrame(
+                                {
+                                    channel.name: pd.Series(channel[:nrows])
+                                    for channel in group.channels()
+                                }
+                            )
 
                         # Clean column names
                         data[gname].rename(
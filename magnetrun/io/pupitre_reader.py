@@ -2,8 +2,8 @@
 
 import pandas as pd
 from pathlib import Path
-from typing import Dict, Any, List
-from .base_reader import BaseReader
+from typing import Dict, Any, Iterator, List, Optional
+from .base_reader import BaseReader, header_lines, read_header
 
 
 class PupitreReader(BaseReader):
@@ -23,27 +23,33 @@ class PupitreReader(BaseReader):
             return False
 
         try:
-            # Read first few lines to check structure
-            with open(filepath, "r") as f:
-                first_line = f.readline().strip()
-                second_line = f.readline().strip()
+            return self.can_read_header(filepath, read_header(filepath))
+        except Exception as e:
+            return False
+
+    def can_read_header(self, filepath: Path, header: bytes) -> bool:
+        """Check if file is a Pupitre format from its leading bytes."""
+        if filepath.suffix.lower() not in self.supported_extensions:
+            return False
 
-            # Pupitre files typically have space-separated values
-            # and don't have the specific bprofile column structure
-            if "," in first_line:
-                return False  # CSV format, likely bprofile
+        # Read first few lines to check structure
+        first_line, second_line = (line.strip() for line in header_lines(header, 2))
 
-            # Check if it looks like whitespace-separated data
-            return len(first_line.split()) > 1 and len(second_line.split()) > 1
+        # Pupitre files typically have space-separated values
+        # and don't have the specific bprofile column structure
+        if "," in first_line:
+            return False  # CSV format, likely bprofile
 
-        except Exception as e:
-            return False
+        # Check if it looks like whitespace-separated data
+        return len(first_line.split()) > 1 and len(second_line.split()) > 1
 
-    def read(self, filepath: Path) -> Dict[str, Any]:
+    def read(self, filepath: Path, nrows: Optional[int] = None) -> Dict[str, Any]:
         """Read Pupitre file."""
         try:
             # Read with whitespace separator, skip first row
-            data = pd.read_csv(filepath, sep=r"\s+", engine="python", skiprows=1)
+            data = pd.read_csv(
+                filepath, sep=r"\s+", engine="python", skiprows=1, nrows=nrows
+            )
 
             return {
                 "data": data,
@@ -56,3 +62,9 @@ class PupitreReader(BaseReader):
             }
         except Exception as e:
             raise ValueError(f"Failed to read Pupitre file {filepath}: {e}")
+
+    def read_chunks(self, filepath: Path, chunksize: int) -> Iterator[pd.DataFrame]:
+        """Read Pupitre file in chunks of chunksize rows."""
+        return pd.read_csv(
+            filepath, sep=r"\s+", engine="python", skiprows=1, chunksize=chunksize
+        )
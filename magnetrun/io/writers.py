@@ -23,7 +23,9 @@ class DataWriter:
         else:
             data = magnet_data.get_data(keys)
         
-        data.to_csv(filepath, sep=separator, index=False, header=True)
+        # A large write buffer instead of the default 8 KiB one
+        with open(filepath, "w", buffering=4 * 1024 * 1024, newline="") as f:
+            data.to_csv(f, sep=separator, index=False, header=True)
     
     @staticmethod
     def to_excel(
@@ -809,4 +809,5 @@ class DataPlotter:
         base_path = Path(file_path).with_suffix("")
         if output_dir:
             base_path = output_dir / base_path.name
-        return base_path.with_suffix(suffix)
+        # The suffixes look like "_Field_vs_t.png", which with_suffix rejects
+        return Path(f"{base_path}{suffix}")
@@ -60,6 +60,16 @@ setup(
             "pytest-benchmark=3.0",
             "hypothesis>=6.0",
         ],
+        "parquet": [
+            "pyarrow>=6.0",
+        ],
+        "excel": [
+            "xlsxwriter>=1.4",
+        ],
+        "fast": [
+            "orjson>=3.6",
+            "numexpr>=2.7",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -0,0 +1,183 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from magnetrun import MagnetData
+from magnetrun.cli.etl import (
+    _align_on_time,
+    _concat_frames,
+    _merge_datasets,
+    _merge_datasets_streaming,
+    _save_merged_data,
+    _write_csv,
+    _write_excel,
+)
+
+
+def _merge_chain(frames):
+    """Reference: the chained outer merges _align_on_time replaced."""
+    merged = frames[0]
+    for frame in frames[1:]:
+        merged = merged.merge(frame, on="t", how="outer")
+    return merged
+
+
+@pytest.fixture
+def frames():
+    return [
+        pd.DataFrame(
+            {
+                "t": [0.0, 1.0, 2.0],
+                "x": [1, 2, 3],
+                "flag": [True, False, True],
+                "stamp": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"]),
+            }
+        ),
+        pd.DataFrame({"t": [0.0, 1.0, 2.0], "y": [4.5, 5.5, 6.5]}),
+        pd.DataFrame({"t": [3.0, 1.0], "z": [7, 8], "name": ["a", "b"]}),
+    ]
+
+
+class TestAlignOnTime:
+    """Test cases for the single-pass time alignment of join merges."""
+
+    @pytest.mark.parametrize("count", [2, 3])
+    def test_matches_merge_chain(self, frames, count):
+        """Test equivalence, dtypes included, with chained outer merges."""
+        frames = frames[:count]
+
+        result = _align_on_time([frame.set_index("t") for frame in frames])
+
+        pd.testing.assert_frame_equal(result, _merge_chain(frames))
+
+    def test_keeps_dtypes_without_missing_rows(self, frames):
+        """Test that int, bool and datetime columns survive a full overlap."""
+        result = _align_on_time([frame.set_index("t") for frame in frames[:2]])
+
+        assert result["x"].dtype == np.int64
+        assert result["flag"].dtype == bool
+        assert result["stamp"].dtype == frames[0]["stamp"].dtype
+
+
+class TestConcatFrames:
+    """Test cases for the preallocated row-wise concatenation."""
+
+    def test_matches_pd_concat(self):
+        """Test equivalence with pd.concat on a shared schema."""
+        frames = [
+            pd.DataFrame({"t": [0.0, 1.0], "n": [1, 2], "s": ["a", "b"]}),
+            pd.DataFrame({"t": [2.0], "n": [3], "s": ["c"]}),
+        ]
+
+        pd.testing.assert_frame_equal(
+            _concat_frames(frames), pd.concat(frames, ignore_index=True)
+        )
+
+    def test_reordered_and_mixed_columns(self):
+        """Test equivalence when column order or dtypes differ."""
+        frames = [
+            pd.DataFrame({"t": [0.0, 1.0], "n": [1, 2]}),
+            pd.DataFrame({"n": [3.5], "t": [2.0]}),
+        ]
+
+        pd.testing.assert_frame_equal(
+            _concat_frames(frames), pd.concat(frames, ignore_index=True)
+        )
+
+    def test_different_columns(self):
+        """Test that differing schemas fall back to pd.concat."""
+        frames = [pd.DataFrame({"a": [1]}), pd.DataFrame({"b": [2]})]
+
+        pd.testing.assert_frame_equal(
+            _concat_frames(frames), pd.concat(frames, ignore_index=True)
+        )
+
+
+class TestWriters:
+    """Test cases for the merged-data writers."""
+
+    def test_write_csv_matches_to_csv(self, tmp_path):
+        """Test that chunked CSV output is identical to DataFrame.to_csv."""
+        data = pd.DataFrame(
+            {
+                "t": np.arange(25) * 0.1,
+                "text": ["a,b", 'q"uote'] * 12 + [None],
+                "cat": pd.Categorical(["x"] * 25),
+            }
+        )
+        result, expected = tmp_path / "result.csv", tmp_path / "expected.csv"
+
+        _write_csv(data, result, chunksize=10)
+        data.to_csv(expected, index=False)
+
+        assert result.read_text() == expected.read_text()
+
+    def test_write_excel_matches_to_excel(self, tmp_path):
+        """Test that the constant_memory writer reads back like to_excel."""
+        pytest.importorskip("xlsxwriter")
+        pytest.importorskip("openpyxl")
+        data = pd.DataFrame(
+            {
+                "t": [0.0, 1.0, np.nan],
+                "n": pd.array([1, None, 3], dtype="Int64"),
+                "text": ["a", None, "c"],
+                "stamp": pd.to_datetime(["2024-01-01 10:00", None, "2024-01-02 00:00"]),
+            }
+        )
+        result, expected = tmp_path / "result.xlsx", tmp_path / "expected.xlsx"
+
+        _write_excel(result, {"Data": data})
+        with pd.ExcelWriter(expected, engine="openpyxl") as writer:
+            data.to_excel(writer, sheet_name="Data", index=False)
+
+        pd.testing.assert_frame_equal(
+            pd.read_excel(result, sheet_name="Data"),
+            pd.read_excel(expected, sheet_name="Data"),
+        )
+
+
+class TestStreamingMerge:
+    """Test cases for the streamed concat merge."""
+
+    @pytest.fixture
+    def datasets(self):
+        return [
+            MagnetData.from_pandas(
+                f"run{i}.txt", pd.DataFrame({"t": [0.0, 1.0], "x": [i, i + 1]})
+            )
+            for i in range(3)
+        ]
+
+    @pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+    def test_matches_in_memory_merge(self, datasets, tmp_path, suffix):
+        """Test that streamed output equals the in-memory concat merge."""
+        if suffix == ".parquet":
+            pytest.importorskip("pyarrow")
+        streamed, in_memory = tmp_path / f"streamed{suffix}", tmp_path / f"memory{suffix}"
+
+        _merge_datasets_streaming(datasets, streamed, True, False)
+        merged = _merge_datasets(datasets, "concat", False, True, False)
+        _save_merged_data(merged, in_memory, False)
+
+        if suffix == ".csv":
+            assert streamed.read_text() == in_memory.read_text()
+        else:
+            pd.testing.assert_frame_equal(
+                pd.read_parquet(streamed), pd.read_parquet(in_memory)
+            )
+        assert (
+            streamed.with_suffix(".field_info.csv").read_text()
+            == in_memory.with_suffix(".field_info.csv").read_text()
+        )
+        assert not list(tmp_path.glob("*.part"))
+
+    def test_failed_merge_leaves_no_output(self, datasets, tmp_path):
+        """Test that an error mid-merge keeps the output path untouched."""
+        output = tmp_path / "merged.csv"
+        datasets[1].get_data = None  # not callable: fails on the second dataset
+
+        with pytest.raises(TypeError):
+            _merge_datasets_streaming(datasets, output, False, False)
+
+        assert not output.exists()
+        assert not list(tmp_path.glob("*.part"))
@@ -0,0 +1,59 @@
+import os
+import shutil
+
+import pytest
+
+from magnetrun.cli.formats import _parallel_copytree
+
+
+def _snapshot(root):
+    """Relative path -> (is_dir, content, mtime) for every entry below root."""
+    entries = {}
+    for current, dirs, files in os.walk(root):
+        for name in dirs + files:
+            path = os.path.join(current, name)
+            content = None if os.path.isdir(path) else open(path, "rb").read()
+            entries[os.path.relpath(path, root)] = (
+                os.path.isdir(path),
+                content,
+                os.stat(path).st_mtime_ns,
+            )
+    return entries
+
+
+class TestParallelCopytree:
+    """Test cases for the threaded formats directory backup."""
+
+    @pytest.fixture
+    def src(self, tmp_path):
+        src = tmp_path / "configs"
+        (src / "nested").mkdir(parents=True)
+        (src / "pupitre.json").write_text('{"format_name": "pupitre"}')
+        (src / "nested" / "bprofile.json").write_text('{"format_name": "bprofile"}')
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        (shared / "a.json").write_text('{"format_name": "a"}')
+        (src / "linked").symlink_to(shared, target_is_directory=True)
+        (src / "alias.json").symlink_to(src / "pupitre.json")
+        for path in [src / "nested", shared, src]:
+            os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+        return src
+
+    def test_matches_shutil_copytree(self, src, tmp_path):
+        """Test equivalence with shutil.copytree, symlinks and times included."""
+        expected, result = tmp_path / "expected", tmp_path / "result"
+
+        shutil.copytree(src, expected)
+        _parallel_copytree(src, result, workers=2)
+
+        assert (result / "linked" / "a.json").is_file()
+        assert _snapshot(result) == _snapshot(expected)
+        assert os.stat(result).st_mtime_ns == os.stat(expected).st_mtime_ns
+
+    def test_existing_destination(self, src, tmp_path):
+        """Test that an existing destination is refused like copytree."""
+        dst = tmp_path / "dst"
+        dst.mkdir()
+
+        with pytest.raises(FileExistsError):
+            _parallel_copytree(src, dst)
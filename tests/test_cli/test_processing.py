@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from magnetrun.cli import processing
+from magnetrun.cli.processing import _filter_chunks, _filter_mask
+
+
+def _loop_filter(data, keys, min_value, max_value, exclude_zeros):
+    """Reference: the per-key mask construction _filter_mask replaced."""
+    mask = pd.Series(True, index=data.index)
+    for key in keys:
+        if min_value is not None:
+            mask = mask & (data[key] >= min_value)
+        if max_value is not None:
+            mask = mask & (data[key] <= max_value)
+        if exclude_zeros:
+            mask = mask & (data[key] != 0)
+    return data[mask]
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "Field": np.round(rng.normal(size=500), 1),
+            "Current": rng.integers(-3, 4, size=500),
+            "label": rng.choice(["a", "b"], size=500),
+        }
+    )
+
+
+THRESHOLDS = [
+    (None, None, False),
+    (-1.0, None, False),
+    (None, 1.0, False),
+    (None, None, True),
+    (-1.0, 1.0, True),
+    (0.5, -0.5, False),
+]
+
+
+class TestFilterMask:
+    """Test cases for the vectorized filter mask."""
+
+    @pytest.mark.parametrize("min_value,max_value,exclude_zeros", THRESHOLDS)
+    @pytest.mark.parametrize("use_numexpr", [True, False])
+    def test_matches_loop(
+        self, data, monkeypatch, min_value, max_value, exclude_zeros, use_numexpr
+    ):
+        """Test equivalence with the per-key loop, with and without NumExpr."""
+        if use_numexpr:
+            pytest.importorskip("numexpr")
+        else:
+            monkeypatch.setattr(processing, "numexpr", None)
+        keys = ["Field", "Current"]
+
+        mask = _filter_mask(
+            data[keys].to_numpy(), min_value, max_value, exclude_zeros
+        )
+
+        pd.testing.assert_frame_equal(
+            data[mask], _loop_filter(data, keys, min_value, max_value, exclude_zeros)
+        )
+
+    def test_no_keys(self, data):
+        """Test that an empty key selection keeps every row."""
+        mask = _filter_mask(data[[]].to_numpy(), 0.0, 1.0, True)
+
+        assert mask.all() and len(mask) == len(data)
+
+
+class TestFilterChunks:
+    """Test cases for the chunked filter writer."""
+
+    @pytest.mark.parametrize("chunksize", [1, 7, 64, 1000])
+    @pytest.mark.parametrize("sample_rate", [None, 3])
+    def test_matches_whole_file(self, data, tmp_path, chunksize, sample_rate):
+        """Test that chunked output equals filtering the whole frame."""
+        output = tmp_path / "out.csv"
+        chunks = (
+            data.iloc[start : start + chunksize]
+            for start in range(0, len(data), chunksize)
+        )
+
+        total, kept = _filter_chunks(chunks, output, (), -1.0, 1.0, True, sample_rate)
+
+        expected = _loop_filter(data, ["Field", "Current"], -1.0, 1.0, True)
+        if sample_rate:
+            expected = expected.iloc[::sample_rate]
+        expected_path = tmp_path / "expected.csv"
+        expected.to_csv(expected_path, index=False)
+        assert (total, kept) == (len(data), len(expected))
+        assert output.read_text() == expected_path.read_text()
+
+    def test_missing_keys(self, data, tmp_path):
+        """Test that unknown explicit keys write nothing."""
+        output = tmp_path / "out.csv"
+
+        assert _filter_chunks([data], output, ("missing",), 0.0, None, False, None) is None
+        assert not output.exists()
+
+    def test_column_turning_non_numeric(self, data, tmp_path):
+        """Test that inferred keys must stay numeric in later chunks."""
+        later = data.iloc[10:20].astype({"Field": object})
+        later.loc[later.index[0], "Field"] = "n/a"
+
+        with pytest.raises(ValueError, match="not numeric"):
+            _filter_chunks(
+                [data.iloc[:10], later], tmp_path / "out.csv", (), 0.0, None, False, None
+            )
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from magnetrun.cli.selection import _nearest_positions
+
+
+def _idxmin_positions(t, targets):
+    """Reference: the per-target scan _nearest_positions replaced."""
+    series = pd.Series(t)
+    return [(series - target).abs().idxmin() for target in targets]
+
+
+class TestNearestPositions:
+    """Test cases for the vectorized time lookup of select extract --time."""
+
+    @pytest.mark.parametrize(
+        "t",
+        [
+            [0.0, 0.5, 1.0, 1.5, 2.0],
+            [1.0, 1.0, 3.0],
+            [0.0, 1.0, 1.0, 1.0, 2.0, 2.0, 3.0],
+            [3.0, 1.0, 2.0, 1.0, 0.0],
+            [0.0, np.nan, 1.0, np.nan, 2.0],
+            [5.0],
+        ],
+    )
+    def test_matches_idxmin(self, t):
+        """Test equivalence with the idxmin scan, ties and NaNs included."""
+        t = np.asarray(t)
+        targets = np.array([-1.0, 0.0, 0.25, 0.5, 1.0, 1.5, 2.0, 2.5, 10.0])
+
+        result = _nearest_positions(t, targets)
+
+        assert result.tolist() == _idxmin_positions(t, targets)
+
+    def test_repeated_times_pick_first_row(self):
+        """Test that a run of equal times resolves to its first row."""
+        result = _nearest_positions(np.array([1.0, 1.0, 3.0]), np.array([1.5]))
+
+        assert result.tolist() == [0]
+
+    def test_random_against_idxmin(self):
+        """Test equivalence on random, rounded (hence repeated) times."""
+        rng = np.random.default_rng(0)
+        t = np.round(rng.uniform(0, 10, 500), 1)
+        targets = np.round(rng.uniform(-1, 11, 200), 2)
+
+        result = _nearest_positions(t, targets)
+
+        assert result.tolist() == _idxmin_positions(t, targets)
+
+    def test_all_nan(self):
+        """Test that a time column without valid values yields None."""
+        assert _nearest_positions(np.array([np.nan, np.nan]), np.array([1.0])) is None
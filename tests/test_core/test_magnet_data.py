@@ -1,10 +1,12 @@
 import pytest
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 from magnetrun import MagnetData, MagnetRun
 from magnetrun.exceptions import FileFormatError, KeyNotFoundError
+from magnetrun.io.pigbrother_reader import PigbrotherReader
 
 
 class TestMagnetData:
@@ -46,6 +48,65 @@ class TestMagnetData:
 
         assert magnet_data is not None
 
+    @patch("magnetrun.io.format_detector.FormatDetector")
+    def test_from_file_nrows(self, mock_detector):
+        """Test that a row limit is forwarded to the reader."""
+        mock_detector_instance = Mock()
+        mock_detector_instance.detect_format.return_value = "pupitre"
+        mock_detector.return_value = mock_detector_instance
+
+        mock_reader = Mock()
+        mock_reader.read.return_value = {
+            "data": pd.DataFrame({"Field": [1], "Current": [3]}),
+            "metadata": {"shape": (1, 2)},
+        }
+        mock_detector_instance.get_reader_for_file.return_value = mock_reader
+
+        with patch("pathlib.Path.exists", return_value=True):
+            magnet_data = MagnetData.from_file("test.txt", nrows=1)
+
+        mock_reader.read.assert_called_once_with(Path("test.txt"), nrows=1)
+        assert len(magnet_data.get_data()) == 1
+
+    def test_from_file_nrows_ragged_tdms(self, tmp_path):
+        """Test that sampling a TDMS group pads short channels like a full read."""
+        nptdms = pytest.importorskip("nptdms")
+
+        tdms_file = tmp_path / "run.tdms"
+        with nptdms.TdmsWriter(str(tdms_file)) as writer:
+            writer.write_segment(
+                [
+                    nptdms.ChannelObject("Group", "long", np.arange(5.0)),
+                    nptdms.ChannelObject("Group", "short", np.arange(3.0)),
+                ]
+            )
+
+        reader = PigbrotherReader()
+        full = reader.read(tdms_file)["data"]["Group"]
+        sampled = reader.read(tdms_file, nrows=4)["data"]["Group"]
+
+        assert full.shape == (5, 2)
+        pd.testing.assert_frame_equal(sampled, full.iloc[:4])
+
+    def test_peek_format(self, tmp_path):
+        """Test format guessing from file headers."""
+        pupitre_file = tmp_path / "run.txt"
+        pupitre_file.write_text("Date Time Field\nx 0 0.0\n")
+        bprofile_file = tmp_path / "profile.txt"
+        bprofile_file.write_text(
+            "Index,Position (mm),Profile at Tr (%),Profile at max (%)\n0,0.0,1.0,1.0\n"
+        )
+        unknown_file = tmp_path / "notes.txt"
+        unknown_file.write_text("nothing")
+        other_suffix = tmp_path / "run.dat"
+        other_suffix.write_text("Date Time Field\nx 0 0.0\n")
+
+        assert MagnetData.peek_format(pupitre_file) == "pupitre"
+        assert MagnetData.peek_format(bprofile_file) == "bprofile"
+        assert MagnetData.peek_format(unknown_file) is None
+        assert MagnetData.peek_format(other_suffix) is None
+        assert MagnetData.peek_format(tmp_path / "missing.txt") is None
+
     def test_get_data_all(self):
         """Test getting all data."""
         df = pd.DataFrame({"Field": [0.0, 0.1, 0.2], "Current": [0.0, 1.0, 2.0]})
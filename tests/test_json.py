@@ -0,0 +1,32 @@
+"""Tests for the JSON helpers."""
+
+import numpy as np
+
+from magnetrun import _json
+
+
+def test_dumps_roundtrip():
+    """Test that dumps output parses back to the same object."""
+    obj = {"format": "pupitre", "fields": [{"name": "Field", "unit": "tesla"}]}
+
+    data = _json.dumps(obj)
+
+    assert isinstance(data, bytes)
+    assert _json.loads(data) == obj
+
+
+def test_dumps_numpy_values():
+    """Test that NumPy scalars and arrays are serialized."""
+    obj = {"count": np.int64(3), "values": np.array([1.0, 2.0])}
+
+    assert _json.loads(_json.dumps(obj)) == {"count": 3, "values": [1.0, 2.0]}
+
+
+def test_dumps_stdlib_fallback(monkeypatch):
+    """Test serialization without orjson installed."""
+    monkeypatch.setattr(_json, "orjson", None)
+
+    data = _json.dumps({"count": np.int64(3), "name": "Température"})
+
+    assert data.startswith(b"{\n  ")
+    assert _json.loads(data) == {"count": 3, "name": "Température"}